@@ -291,7 +291,8 @@ CAMERA_CONFIG = {
     "fps": 30,
     "buffer_size": 1,
     "flip_horizontal": True,
-    "codec": "MJPG"
+    "codec": "MJPG",
+    "use_webrtc": False
 }
 
 # Database Configuration
@@ -28,6 +28,7 @@ class CameraManager:
         self.is_running = False
         self.current_frame = None
         self.processed_frame = None
+        self.frame_id = 0
         self.recognition_results = {}
         self.feedback_overlay = None
         self.recording_session = False
@@ -191,43 +192,7 @@ class CameraManager:
                     logger.warning("Frame too small, skipping")
                     continue
                 
-                # Mirror the frame if enabled
-                if self.mirror_mode:
-                    frame = cv2.flip(frame, 1)
-                
-                # Process frame with hand tracking
-                try:
-                    processed_frame, hands_detected = self.hand_tracker.process_frame(frame.copy())
-                except Exception as ht_error:
-                    logger.error(f"Hand tracking error: {str(ht_error)}")
-                    processed_frame = frame.copy()
-                    hands_detected = False
-                
-                # Add visual feedback overlay
-                if hands_detected:
-                    try:
-                        self._add_hand_landmarks(processed_frame)
-                        
-                        # Get hand features for recognition
-                        hand_features = self.hand_tracker.get_hand_features()
-                        if hand_features is not None:
-                            self._process_sign_recognition(processed_frame, hand_features)
-                    except Exception as proc_error:
-                        logger.error(f"Processing error: {str(proc_error)}")
-                
-                # Add UI overlays
-                try:
-                    self._add_ui_overlays(processed_frame)
-                except Exception as ui_error:
-                    logger.error(f"UI overlay error: {str(ui_error)}")
-                
-                # Store processed frame safely
-                try:
-                    with self.frame_lock:
-                        self.current_frame = frame.copy()
-                        self.processed_frame = processed_frame.copy()
-                except Exception as store_error:
-                    logger.error(f"Frame storage error: {str(store_error)}")
+                self.process_frame(frame)
                 
                 # Control frame rate
                 time.sleep(max(0.01, 1.0 / self.fps))
@@ -243,6 +208,49 @@ class CameraManager:
                 
                 time.sleep(0.5)
     
+    def process_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Run hand tracking, recognition and overlays on one BGR frame and store the result"""
+        # Mirror the frame if enabled
+        if self.mirror_mode:
+            frame = cv2.flip(frame, 1)
+        
+        # Process frame with hand tracking
+        try:
+            processed_frame, hands_detected = self.hand_tracker.process_frame(frame.copy())
+        except Exception as ht_error:
+            logger.error(f"Hand tracking error: {str(ht_error)}")
+            processed_frame = frame.copy()
+            hands_detected = False
+        
+        # Add visual feedback overlay
+        if hands_detected:
+            try:
+                self._add_hand_landmarks(processed_frame)
+                
+                # Get hand features for recognition
+                hand_features = self.hand_tracker.get_hand_features()
+                if hand_features is not None:
+                    self._process_sign_recognition(processed_frame, hand_features)
+            except Exception as proc_error:
+                logger.error(f"Processing error: {str(proc_error)}")
+        
+        # Add UI overlays
+        try:
+            self._add_ui_overlays(processed_frame)
+        except Exception as ui_error:
+            logger.error(f"UI overlay error: {str(ui_error)}")
+        
+        # Store processed frame safely
+        try:
+            with self.frame_lock:
+                self.current_frame = frame.copy()
+                self.processed_frame = processed_frame.copy()
+                self.frame_id += 1
+        except Exception as store_error:
+            logger.error(f"Frame storage error: {str(store_error)}")
+        
+        return processed_frame
+    
     def _add_hand_landmarks(self, frame: np.ndarray):
         """Add hand landmark visualization to frame"""
         if self.show_landmarks and self.hand_tracker.results:
@@ -401,6 +409,13 @@ class CameraManager:
         with self.frame_lock:
             return self.processed_frame.copy() if self.processed_frame is not None else None
     
+    def get_current_frame_with_id(self) -> Tuple[Optional[np.ndarray], int]:
+        """Get current processed frame with its monotonically increasing frame id"""
+        with self.frame_lock:
+            if self.processed_frame is None:
+                return None, self.frame_id
+            return self.processed_frame.copy(), self.frame_id
+    
     def get_frame_as_base64(self) -> Optional[str]:
         """Get current frame as base64 encoded string"""
         frame = self.get_current_frame()
@@ -17,6 +17,29 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Key landmark pairs for sign language recognition
+_DISTANCE_PAIRS = np.array([
+    (0, 4),   # thumb tip to wrist
+    (0, 8),   # index finger tip to wrist
+    (0, 12),  # middle finger tip to wrist
+    (0, 16),  # ring finger tip to wrist
+    (0, 20),  # pinky tip to wrist
+    (4, 8),   # thumb to index finger
+    (8, 12),  # index to middle finger
+    (12, 16), # middle to ring finger
+    (16, 20), # ring to pinky finger
+], dtype=np.intp)
+
+# Key angle triplets (middle point, point1, point2)
+_ANGLE_TRIPLETS = np.array([
+    (0, 1, 2),   # wrist angle
+    (1, 2, 3),   # thumb base angle
+    (5, 6, 7),   # index finger angle
+    (9, 10, 11), # middle finger angle
+    (13, 14, 15), # ring finger angle
+    (17, 18, 19), # pinky angle
+], dtype=np.intp)
+
 class HandTracker:
     """Real-time hand tracking using MediaPipe"""
     
@@ -35,6 +58,7 @@ class HandTracker:
                 min_tracking_confidence=hand_config["min_tracking_confidence"],
                 max_num_hands=hand_config["max_num_hands"]
             )
+            self._build_drawing_tables()
         else:
             self.mp_hands = None
             self.mp_drawing = None
@@ -42,6 +66,8 @@ class HandTracker:
             self.hands = None
             
         self.results = None
+        self.pixel_landmarks = []
+        self.pixel_frame_size = None
         self.fallback_mode = not MEDIAPIPE_AVAILABLE
         
     def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, bool]:
@@ -72,6 +98,11 @@ class HandTracker:
             
             hands_detected = self.results.multi_hand_landmarks is not None
             
+            # Quantize landmarks to pixel space once for downstream consumers
+            height, width = frame.shape[:2]
+            self.pixel_landmarks = self._to_pixel_landmarks(width, height) if hands_detected else []
+            self.pixel_frame_size = (width, height)
+            
             return bgr_frame, hands_detected
             
         except Exception as e:
@@ -89,18 +120,73 @@ class HandTracker:
             Frame with landmarks drawn
         """
         if self.results and self.results.multi_hand_landmarks:
+            height, width = frame.shape[:2]
+            scale = np.array([width, height], dtype=np.float64)
+            limit = np.array([width - 1, height - 1], dtype=np.int32)
+            
             for hand_landmarks in self.results.multi_hand_landmarks:
-                # Draw landmarks
-                self.mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style()
-                )
+                landmarks = hand_landmarks.landmark
+                pts = np.fromiter(
+                    (v for lm in landmarks for v in (lm.x, lm.y)),
+                    dtype=np.float64, count=len(landmarks) * 2
+                ).reshape(-1, 2)
+                
+                # Same pixel mapping as MediaPipe: off-image landmarks are skipped
+                inside = (pts >= 0.0) & (pts <= 1.0)
+                visible = inside[:, 0] & inside[:, 1]
+                pixels = np.minimum(np.floor(pts * scale).astype(np.int32), limit)
+                
+                # One polylines call per connection style instead of one line per connection
+                for color, thickness, connections in self._connection_groups:
+                    shown = connections[visible[connections].all(axis=1)]
+                    if len(shown):
+                        cv2.polylines(frame, list(pixels[shown]), False, color, thickness)
+                
+                # Landmark points go on top of the connections
+                for idx in np.flatnonzero(visible).tolist():
+                    color, thickness, radius, border_radius = self._landmark_specs[idx]
+                    center = (int(pixels[idx, 0]), int(pixels[idx, 1]))
+                    cv2.circle(frame, center, border_radius, self._landmark_border_color, thickness)
+                    cv2.circle(frame, center, radius, color, thickness)
         
         return frame
     
+    def _to_pixel_landmarks(self, width: int, height: int) -> List[np.ndarray]:
+        """Convert each detected hand's landmarks to an (N, 2) int16 array of pixel coordinates"""
+        try:
+            scale = np.array([width, height], dtype=np.float32)
+            pixel_landmarks = []
+            for hand_landmarks in self.results.multi_hand_landmarks:
+                landmarks = hand_landmarks.landmark
+                pts = np.fromiter(
+                    (v for lm in landmarks for v in (lm.x, lm.y)),
+                    dtype=np.float32, count=len(landmarks) * 2
+                ).reshape(-1, 2)
+                pixel_landmarks.append((pts * scale).astype(np.int16))
+            return pixel_landmarks
+        except Exception as e:
+            logger.error(f"Error converting landmarks to pixels: {str(e)}")
+            return []
+    
+    def _build_drawing_tables(self):
+        """Precompute connection index arrays and landmark styles for draw_landmarks"""
+        connection_style = self.mp_drawing_styles.get_default_hand_connections_style()
+        groups = {}
+        for connection in self.mp_hands.HAND_CONNECTIONS:
+            spec = connection_style[connection]
+            groups.setdefault((spec.color, spec.thickness), []).append(connection)
+        self._connection_groups = [
+            (color, thickness, np.array(connections, dtype=np.intp))
+            for (color, thickness), connections in groups.items()
+        ]
+        
+        self._landmark_border_color = self.mp_drawing.WHITE_COLOR
+        landmark_style = self.mp_drawing_styles.get_default_hand_landmarks_style()
+        self._landmark_specs = [None] * len(landmark_style)
+        for landmark, spec in landmark_style.items():
+            border_radius = max(spec.circle_radius + 1, int(spec.circle_radius * 1.2))
+            self._landmark_specs[int(landmark)] = (spec.color, spec.thickness, spec.circle_radius, border_radius)
+    
     def get_landmarks(self) -> List[Dict[str, Any]]:
         """
         Extract normalized hand landmarks
@@ -166,92 +252,58 @@ class HandTracker:
         features = []
         
         for hand_data in landmarks_data:
-            landmarks = hand_data['landmarks']
-            
-            # Extract basic landmark coordinates
-            coords = []
-            for landmark in landmarks:
-                coords.extend([landmark['x'], landmark['y'], landmark['z']])
+            # Basic landmark coordinates as one (N, 3) array
+            points = np.array(
+                [[landmark['x'], landmark['y'], landmark['z']] for landmark in hand_data['landmarks']],
+                dtype=np.float64
+            ).reshape(-1, 3)
             
-            # Calculate distances between key landmarks
-            distances = self._calculate_landmark_distances(landmarks)
-            
-            # Calculate angles between landmarks
-            angles = self._calculate_landmark_angles(landmarks)
+            # Distances and angles between key landmarks
+            distances = self._calculate_landmark_distances(points)
+            angles = self._calculate_landmark_angles(points)
             
             # Combine all features
-            hand_features = coords + distances + angles
-            features.extend(hand_features)
+            features.append(np.concatenate((points.ravel(), distances, angles)))
         
-        return np.array(features) if features else None
+        return np.concatenate(features) if features else None
     
-    def _calculate_landmark_distances(self, landmarks: List[Dict]) -> List[float]:
-        """Calculate distances between key hand landmarks"""
-        distances = []
-        
-        # Key landmark indices for sign language recognition
-        key_pairs = [
-            (0, 4),   # thumb tip to wrist
-            (0, 8),   # index finger tip to wrist
-            (0, 12),  # middle finger tip to wrist
-            (0, 16),  # ring finger tip to wrist
-            (0, 20),  # pinky tip to wrist
-            (4, 8),   # thumb to index finger
-            (8, 12),  # index to middle finger
-            (12, 16), # middle to ring finger
-            (16, 20), # ring to pinky finger
-        ]
-        
-        for p1, p2 in key_pairs:
-            if p1 < len(landmarks) and p2 < len(landmarks):
-                dist = self._euclidean_distance(landmarks[p1], landmarks[p2])
-                distances.append(dist)
-        
-        return distances
+    def _calculate_landmark_distances(self, points: np.ndarray) -> np.ndarray:
+        """Calculate distances between key hand landmarks of an (N, 3) array"""
+        pairs = _DISTANCE_PAIRS[(_DISTANCE_PAIRS < len(points)).all(axis=1)]
+        return self._euclidean_distances_batch(points[pairs[:, 0]], points[pairs[:, 1]])
     
-    def _calculate_landmark_angles(self, landmarks: List[Dict]) -> List[float]:
-        """Calculate angles between landmark triplets"""
-        angles = []
-        
-        # Key angle triplets (middle point, point1, point2)
-        angle_triplets = [
-            (0, 1, 2),   # wrist angle
-            (1, 2, 3),   # thumb base angle
-            (5, 6, 7),   # index finger angle
-            (9, 10, 11), # middle finger angle
-            (13, 14, 15), # ring finger angle
-            (17, 18, 19), # pinky angle
-        ]
-        
-        for mid, p1, p2 in angle_triplets:
-            if all(i < len(landmarks) for i in [mid, p1, p2]):
-                angle = self._calculate_angle(landmarks[mid], landmarks[p1], landmarks[p2])
-                angles.append(angle)
-        
-        return angles
+    def _calculate_landmark_angles(self, points: np.ndarray) -> np.ndarray:
+        """Calculate angles between landmark triplets of an (N, 3) array"""
+        triplets = _ANGLE_TRIPLETS[(_ANGLE_TRIPLETS < len(points)).all(axis=1)]
+        return self._calculate_angles_batch(points[triplets[:, 0]], points[triplets[:, 1]], points[triplets[:, 2]])
     
-    def _euclidean_distance(self, p1: Dict, p2: Dict) -> float:
-        """Calculate Euclidean distance between two 3D points"""
-        return np.sqrt(
-            (p1['x'] - p2['x'])**2 + 
-            (p1['y'] - p2['y'])**2 + 
-            (p1['z'] - p2['z'])**2
-        )
+    @staticmethod
+    def _as_point(point: Any) -> np.ndarray:
+        """Convert an {'x', 'y', 'z'} landmark dict to an array; arrays pass through"""
+        if isinstance(point, dict):
+            return np.array([point['x'], point['y'], point['z']], dtype=np.float64)
+        return np.asarray(point, dtype=np.float64)
     
-    def _calculate_angle(self, center: Dict, p1: Dict, p2: Dict) -> float:
-        """Calculate angle between three points"""
-        # Vector from center to p1
-        v1 = np.array([p1['x'] - center['x'], p1['y'] - center['y'], p1['z'] - center['z']])
-        
-        # Vector from center to p2
-        v2 = np.array([p2['x'] - center['x'], p2['y'] - center['y'], p2['z'] - center['z']])
-        
-        # Calculate angle using dot product
-        cos_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2))
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)  # Ensure valid range
-        
-        angle = np.arccos(cos_angle)
-        return np.degrees(angle)
+    def _euclidean_distances_batch(self, points_a: np.ndarray, points_b: np.ndarray) -> np.ndarray:
+        """Row-wise Euclidean distances between two (..., 3) point arrays"""
+        return np.linalg.norm(points_a - points_b, axis=-1)
+    
+    def _calculate_angles_batch(self, centers: np.ndarray, points_1: np.ndarray, points_2: np.ndarray) -> np.ndarray:
+        """Row-wise angles in degrees at each center between two (..., 3) point arrays"""
+        v1 = points_1 - centers
+        v2 = points_2 - centers
+        # atan2(|v1 x v2|, v1 . v2) stays accurate near 0 and 180 degrees, unlike arccos
+        sin_term = np.linalg.norm(np.cross(v1, v2), axis=-1)
+        cos_term = np.einsum('...i,...i', v1, v2)
+        return np.degrees(np.arctan2(sin_term, cos_term))
+    
+    def _euclidean_distance(self, p1: Any, p2: Any) -> float:
+        """Calculate Euclidean distance between two 3D points (landmark dicts or arrays)"""
+        return float(self._euclidean_distances_batch(self._as_point(p1), self._as_point(p2)))
+    
+    def _calculate_angle(self, center: Any, p1: Any, p2: Any) -> float:
+        """Calculate angle between three points (landmark dicts or arrays)"""
+        return float(self._calculate_angles_batch(self._as_point(center), self._as_point(p1), self._as_point(p2)))
     
     def get_hand_bounding_box(self) -> Optional[Tuple[int, int, int, int]]:
         """
@@ -5,177 +5,184 @@ Handles language selection, metadata, and multilingual support
 
 from typing import Dict, List, Optional, Any
 import json
+from types import MappingProxyType
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Static language table shared by every LanguageManager instance
+_SUPPORTED_LANGUAGES = MappingProxyType({
+    "ASL": MappingProxyType({
+        "name": "American Sign Language",
+        "flag": "🇺🇸",
+        "region": "North America", 
+        "difficulty": "Medium",
+        "users": "500,000+",
+        "description": "The primary sign language of deaf communities in the United States and Canada."
+    }),
+    "BSL": MappingProxyType({
+        "name": "British Sign Language",
+        "flag": "🇬🇧", 
+        "region": "Europe",
+        "difficulty": "Medium",
+        "users": "150,000+",
+        "description": "The sign language used in the United Kingdom and Northern Ireland."
+    }),
+    "LSF": MappingProxyType({
+        "name": "French Sign Language",
+        "flag": "🇫🇷",
+        "region": "Europe", 
+        "difficulty": "Medium",
+        "users": "100,000+",
+        "description": "The sign language of the deaf community in France."
+    }),
+    "DGS": MappingProxyType({
+        "name": "German Sign Language",
+        "flag": "🇩🇪",
+        "region": "Europe",
+        "difficulty": "Hard",
+        "users": "80,000+", 
+        "description": "The sign language of the deaf community in Germany."
+    }),
+    "JSL": MappingProxyType({
+        "name": "Japanese Sign Language",
+        "flag": "🇯🇵",
+        "region": "Asia",
+        "difficulty": "Hard",
+        "users": "320,000+",
+        "description": "The sign language of the deaf community in Japan."
+    }),
+    "CSL": MappingProxyType({
+        "name": "Chinese Sign Language", 
+        "flag": "🇨🇳",
+        "region": "Asia",
+        "difficulty": "Hard",
+        "users": "20M+",
+        "description": "The sign language used by the deaf community in China."
+    }),
+    "LIBRAS": MappingProxyType({
+        "name": "Brazilian Sign Language",
+        "flag": "🇧🇷", 
+        "region": "South America",
+        "difficulty": "Medium",
+        "users": "5M+",
+        "description": "The sign language of the deaf community in Brazil."
+    }),
+    "LSE": MappingProxyType({
+        "name": "Spanish Sign Language",
+        "flag": "🇪🇸",
+        "region": "Europe",
+        "difficulty": "Medium", 
+        "users": "120,000+",
+        "description": "The sign language used in Spain."
+    }),
+    "LSP": MappingProxyType({
+        "name": "Portuguese Sign Language",
+        "flag": "🇵🇹",
+        "region": "Europe",
+        "difficulty": "Medium",
+        "users": "60,000+",
+        "description": "The sign language of the deaf community in Portugal."
+    }),
+    "AUSLAN": MappingProxyType({
+        "name": "Australian Sign Language",
+        "flag": "🇦🇺",
+        "region": "Oceania",
+        "difficulty": "Medium",
+        "users": "16,000+",
+        "description": "The sign language of the Australian deaf community."
+    }),
+    "ISL": MappingProxyType({
+        "name": "Indian Sign Language",
+        "flag": "🇮🇳", 
+        "region": "Asia",
+        "difficulty": "Medium",
+        "users": "2.7M+",
+        "description": "The sign language used by the deaf community in India."
+    }),
+    "RSL": MappingProxyType({
+        "name": "Russian Sign Language",
+        "flag": "🇷🇺",
+        "region": "Europe/Asia",
+        "difficulty": "Hard",
+        "users": "120,000+",
+        "description": "The sign language of the deaf community in Russia."
+    }),
+    "TSL": MappingProxyType({
+        "name": "Thai Sign Language",
+        "flag": "🇹🇭",
+        "region": "Asia", 
+        "difficulty": "Medium",
+        "users": "56,000+",
+        "description": "The sign language used in Thailand."
+    }),
+    "KSL": MappingProxyType({
+        "name": "Korean Sign Language",
+        "flag": "🇰🇷",
+        "region": "Asia",
+        "difficulty": "Hard",
+        "users": "300,000+",
+        "description": "The sign language of the deaf community in South Korea."
+    }),
+    "NZSL": MappingProxyType({
+        "name": "New Zealand Sign Language",
+        "flag": "🇳🇿",
+        "region": "Oceania",
+        "difficulty": "Medium", 
+        "users": "24,000+",
+        "description": "The sign language of New Zealand's deaf community."
+    }),
+    "SASL": MappingProxyType({
+        "name": "South African Sign Language",
+        "flag": "🇿🇦",
+        "region": "Africa",
+        "difficulty": "Medium",
+        "users": "600,000+",
+        "description": "The sign language used in South Africa."
+    }),
+    "FinSL": MappingProxyType({
+        "name": "Finnish Sign Language",
+        "flag": "🇫🇮",
+        "region": "Europe",
+        "difficulty": "Hard",
+        "users": "14,000+",
+        "description": "The sign language of the Finnish deaf community."
+    }),
+    "SSL": MappingProxyType({
+        "name": "Swedish Sign Language", 
+        "flag": "🇸🇪",
+        "region": "Europe",
+        "difficulty": "Medium",
+        "users": "35,000+",
+        "description": "The sign language used in Sweden."
+    }),
+    "DSL": MappingProxyType({
+        "name": "Danish Sign Language",
+        "flag": "🇩🇰",
+        "region": "Europe",
+        "difficulty": "Medium",
+        "users": "5,000+",
+        "description": "The sign language of the Danish deaf community."
+    }),
+    "NSL": MappingProxyType({
+        "name": "Norwegian Sign Language",
+        "flag": "🇳🇴",
+        "region": "Europe", 
+        "difficulty": "Medium",
+        "users": "5,000+",
+        "description": "The sign language used in Norway."
+    })
+})
+
 class LanguageManager:
     """Manages supported sign languages and their metadata"""
     
     def __init__(self):
         """Initialize the language manager with supported languages"""
-        self.supported_languages = {
-            "ASL": {
-                "name": "American Sign Language",
-                "flag": "🇺🇸",
-                "region": "North America", 
-                "difficulty": "Medium",
-                "users": "500,000+",
-                "description": "The primary sign language of deaf communities in the United States and Canada."
-            },
-            "BSL": {
-                "name": "British Sign Language",
-                "flag": "🇬🇧", 
-                "region": "Europe",
-                "difficulty": "Medium",
-                "users": "150,000+",
-                "description": "The sign language used in the United Kingdom and Northern Ireland."
-            },
-            "LSF": {
-                "name": "French Sign Language",
-                "flag": "🇫🇷",
-                "region": "Europe", 
-                "difficulty": "Medium",
-                "users": "100,000+",
-                "description": "The sign language of the deaf community in France."
-            },
-            "DGS": {
-                "name": "German Sign Language",
-                "flag": "🇩🇪",
-                "region": "Europe",
-                "difficulty": "Hard",
-                "users": "80,000+", 
-                "description": "The sign language of the deaf community in Germany."
-            },
-            "JSL": {
-                "name": "Japanese Sign Language",
-                "flag": "🇯🇵",
-                "region": "Asia",
-                "difficulty": "Hard",
-                "users": "320,000+",
-                "description": "The sign language of the deaf community in Japan."
-            },
-            "CSL": {
-                "name": "Chinese Sign Language", 
-                "flag": "🇨🇳",
-                "region": "Asia",
-                "difficulty": "Hard",
-                "users": "20M+",
-                "description": "The sign language used by the deaf community in China."
-            },
-            "LIBRAS": {
-                "name": "Brazilian Sign Language",
-                "flag": "🇧🇷", 
-                "region": "South America",
-                "difficulty": "Medium",
-                "users": "5M+",
-                "description": "The sign language of the deaf community in Brazil."
-            },
-            "LSE": {
-                "name": "Spanish Sign Language",
-                "flag": "🇪🇸",
-                "region": "Europe",
-                "difficulty": "Medium", 
-                "users": "120,000+",
-                "description": "The sign language used in Spain."
-            },
-            "LSP": {
-                "name": "Portuguese Sign Language",
-                "flag": "🇵🇹",
-                "region": "Europe",
-                "difficulty": "Medium",
-                "users": "60,000+",
-                "description": "The sign language of the deaf community in Portugal."
-            },
-            "AUSLAN": {
-                "name": "Australian Sign Language",
-                "flag": "🇦🇺",
-                "region": "Oceania",
-                "difficulty": "Medium",
-                "users": "16,000+",
-                "description": "The sign language of the Australian deaf community."
-            },
-            "ISL": {
-                "name": "Indian Sign Language",
-                "flag": "🇮🇳", 
-                "region": "Asia",
-                "difficulty": "Medium",
-                "users": "2.7M+",
-                "description": "The sign language used by the deaf community in India."
-            },
-            "RSL": {
-                "name": "Russian Sign Language",
-                "flag": "🇷🇺",
-                "region": "Europe/Asia",
-                "difficulty": "Hard",
-                "users": "120,000+",
-                "description": "The sign language of the deaf community in Russia."
-            },
-            "TSL": {
-                "name": "Thai Sign Language",
-                "flag": "🇹🇭",
-                "region": "Asia", 
-                "difficulty": "Medium",
-                "users": "56,000+",
-                "description": "The sign language used in Thailand."
-            },
-            "KSL": {
-                "name": "Korean Sign Language",
-                "flag": "🇰🇷",
-                "region": "Asia",
-                "difficulty": "Hard",
-                "users": "300,000+",
-                "description": "The sign language of the deaf community in South Korea."
-            },
-            "NZSL": {
-                "name": "New Zealand Sign Language",
-                "flag": "🇳🇿",
-                "region": "Oceania",
-                "difficulty": "Medium", 
-                "users": "24,000+",
-                "description": "The sign language of New Zealand's deaf community."
-            },
-            "SASL": {
-                "name": "South African Sign Language",
-                "flag": "🇿🇦",
-                "region": "Africa",
-                "difficulty": "Medium",
-                "users": "600,000+",
-                "description": "The sign language used in South Africa."
-            },
-            "FinSL": {
-                "name": "Finnish Sign Language",
-                "flag": "🇫🇮",
-                "region": "Europe",
-                "difficulty": "Hard",
-                "users": "14,000+",
-                "description": "The sign language of the Finnish deaf community."
-            },
-            "SSL": {
-                "name": "Swedish Sign Language", 
-                "flag": "🇸🇪",
-                "region": "Europe",
-                "difficulty": "Medium",
-                "users": "35,000+",
-                "description": "The sign language used in Sweden."
-            },
-            "DSL": {
-                "name": "Danish Sign Language",
-                "flag": "🇩🇰",
-                "region": "Europe",
-                "difficulty": "Medium",
-                "users": "5,000+",
-                "description": "The sign language of the Danish deaf community."
-            },
-            "NSL": {
-                "name": "Norwegian Sign Language",
-                "flag": "🇳🇴",
-                "region": "Europe", 
-                "difficulty": "Medium",
-                "users": "5,000+",
-                "description": "The sign language used in Norway."
-            }
-        }
+        self.supported_languages = _SUPPORTED_LANGUAGES
+        
+        # Case-folded codes for language_exists; built once, the table is static
+        self._language_codes_lower = frozenset(code.lower() for code in self.supported_languages)
         
         self.current_language = "ASL"
         
@@ -195,6 +202,11 @@ class LanguageManager:
         """Get list of language codes"""
         return list(self.supported_languages.keys())
     
+    def language_exists(self, language_code: str) -> bool:
+        """Check whether a language code is supported, ignoring case"""
+        # Exact-case codes skip the lower() allocation
+        return language_code in self.supported_languages or language_code.lower() in self._language_codes_lower
+    
     def set_current_language(self, language_code: str) -> bool:
         """Set the current active language"""
         if language_code in self.supported_languages:
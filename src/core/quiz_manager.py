@@ -3,33 +3,394 @@ Quiz Manager for Sign Language Learning Platform
 Contains 5 comprehensive quizzes for each of the 20+ supported languages (100 total quizzes)
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Mapping, NamedTuple, Optional, Sequence, Tuple
+import functools
+import hashlib
 import random
 import json
+import os
+import sys
+import tempfile
+import threading
+from collections import Counter
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
 import logging
 from src.config.settings import SUPPORTED_LANGUAGES
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Question types and difficulty tags shared by every generated question
+_MULTIPLE_CHOICE, _TRUE_FALSE, _SEQUENCE, _OPEN_ENDED, _MATCHING = map(
+    sys.intern, ("multiple_choice", "true_false", "sequence", "open_ended", "matching")
+)
+_EASY, _MEDIUM, _HARD = map(sys.intern, ("Easy", "Medium", "Hard"))
+
+# Position of each quiz type in a language's quiz list (see _generate_language_quizzes)
+_QUIZ_TYPE_INDEX: Dict[str, int] = {
+    "basics": 0,
+    "numbers": 1,
+    "family": 2,
+    "emotions": 3,
+    "advanced": 4
+}
+
+# Culturally specific signs per language, built once at import
+_CULTURAL_SIGNS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "ASL": {
+        "culture": ("American", "baseball", "football", "hamburger", "democracy"),
+        "places": ("Washington DC", "New York", "California", "Texas")
+    },
+    "BSL": {
+        "culture": ("British", "tea", "football (soccer)", "fish and chips", "queue"),
+        "places": ("London", "England", "Scotland", "Wales")
+    },
+    "LSP": {
+        "culture": ("Portuguese", "fado", "football", "port wine", "azulejo"),
+        "places": ("Lisbon", "Porto", "Portugal", "Algarve")
+    },
+    "LSE": {
+        "culture": ("Spanish", "flamenco", "paella", "siesta", "bullfighting"),
+        "places": ("Madrid", "Barcelona", "Spain", "Andalusia")
+    },
+    "DGS": {
+        "culture": ("German", "beer", "sausage", "oktoberfest", "precision"),
+        "places": ("Berlin", "Munich", "Germany", "Bavaria")
+    },
+    "LSF": {
+        "culture": ("French", "wine", "cheese", "baguette", "romance"),
+        "places": ("Paris", "Lyon", "France", "Normandy")
+    },
+    "JSL": {
+        "culture": ("Japanese", "sushi", "origami", "bowing", "harmony"),
+        "places": ("Tokyo", "Kyoto", "Japan", "Osaka")
+    },
+    "CSL": {
+        "culture": ("Chinese", "rice", "tea ceremony", "kung fu", "dragon"),
+        "places": ("Beijing", "Shanghai", "China", "Hong Kong")
+    },
+    "AUSLAN": {
+        "culture": ("Australian", "kangaroo", "koala", "beach", "mate"),
+        "places": ("Sydney", "Melbourne", "Australia", "Brisbane")
+    },
+    "NZSL": {
+        "culture": ("New Zealand", "kiwi", "rugby", "haka", "sheep"),
+        "places": ("Auckland", "Wellington", "Christchurch", "New Zealand")
+    },
+    "ISL": {
+        "culture": ("Italian", "pasta", "pizza", "opera", "art"),
+        "places": ("Rome", "Milan", "Venice", "Italy")
+    },
+    "RSL": {
+        "culture": ("Russian", "vodka", "ballet", "borscht", "cold"),
+        "places": ("Moscow", "St. Petersburg", "Russia", "Siberia")
+    },
+    "LIBRAS": {
+        "culture": ("Brazilian", "carnival", "football", "capoeira", "beach"),
+        "places": ("Rio de Janeiro", "São Paulo", "Brazil", "Amazon")
+    },
+    "LSM": {
+        "culture": ("Mexican", "tacos", "mariachi", "día de los muertos", "spicy"),
+        "places": ("Mexico City", "Guadalajara", "Mexico", "Cancun")
+    },
+    "ISN": {
+        "culture": ("Nicaraguan", "coffee", "lakes", "volcanos", "revolution"),
+        "places": ("Managua", "León", "Nicaragua", "Granada")
+    },
+    "VGT": {
+        "culture": ("Flemish", "waffles", "chocolate", "beer", "art"),
+        "places": ("Brussels", "Antwerp", "Belgium", "Ghent")
+    },
+    "SSL": {
+        "culture": ("Swedish", "meatballs", "IKEA", "cold", "northern lights"),
+        "places": ("Stockholm", "Gothenburg", "Sweden", "Lapland")
+    },
+    "NSL": {
+        "culture": ("Norwegian", "fjords", "salmon", "oil", "northern lights"),
+        "places": ("Oslo", "Bergen", "Norway", "Tromsø")
+    },
+    "DSL": {
+        "culture": ("Danish", "hygge", "pastries", "vikings", "bicycles"),
+        "places": ("Copenhagen", "Aarhus", "Denmark", "Greenland")
+    },
+    "FSL": {
+        "culture": ("Finnish", "sauna", "Nokia", "reindeer", "northern lights"),
+        "places": ("Helsinki", "Tampere", "Finland", "Lapland")
+    },
+    "KSL": {
+        "culture": ("Korean", "kimchi", "k-pop", "taekwondo", "technology"),
+        "places": ("Seoul", "Busan", "South Korea", "Jeju")
+    }
+}
+
+_EMPTY_CULTURAL: Dict[str, Tuple[str, ...]] = {"culture": (), "places": ()}
+
+# Base signs that are common across all sign languages but may have cultural variations
+_BASE_VOCABULARY_TEMPLATE: Dict[str, Tuple[str, ...]] = {
+    "greetings": ("hello", "goodbye", "good morning", "good evening", "nice to meet you", "how are you", "thank you", "please", "excuse me", "sorry"),
+    "numbers": ("1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15", "16", "17", "18", "19", "20"),
+    "family": ("mother", "father", "sister", "brother", "grandmother", "grandfather", "aunt", "uncle", "cousin", "family"),
+    "emotions": ("happy", "sad", "angry", "excited", "tired", "surprised", "worried", "calm", "confused", "proud"),
+    "colors": ("red", "blue", "green", "yellow", "black", "white", "orange", "purple", "pink", "brown"),
+    "food": ("eat", "drink", "hungry", "thirsty", "breakfast", "lunch", "dinner", "water", "milk", "bread"),
+    "time": ("today", "tomorrow", "yesterday", "morning", "afternoon", "evening", "night", "week", "month", "year"),
+    "actions": ("go", "come", "sit", "stand", "walk", "run", "sleep", "wake up", "work", "study"),
+    "places": ("home", "school", "work", "hospital", "store", "restaurant", "park", "library", "church", "city"),
+    "nature": ("sun", "moon", "star", "tree", "flower", "rain", "snow", "wind", "fire", "water")
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _base_signs_for_language(lang_code: str) -> Mapping[str, Tuple[str, ...]]:
+    """Base vocabulary merged with a language's cultural signs, built once per language"""
+    vocabulary = dict(_BASE_VOCABULARY_TEMPLATE)
+    for category, signs in _CULTURAL_SIGNS.get(lang_code, _EMPTY_CULTURAL).items():
+        vocabulary[category] = vocabulary.get(category, ()) + signs
+    return MappingProxyType(vocabulary)
+
+
+def _distractors(pool: Sequence[str], correct_idx: int, k: int, rng: random.Random) -> List[str]:
+    """Build answer options: pool[correct_idx] first, then k distinct wrong answers from pool.
+    
+    Wrong answers are sampled by index, skipping the correct one, so the pool is never copied.
+    """
+    options = [pool[correct_idx]] * (k + 1)
+    options[1:] = (pool[i + 1] if i >= correct_idx else pool[i] for i in rng.sample(range(len(pool) - 1), k))
+    return options
+
+
+class Question(NamedTuple):
+    """A single quiz question, stored internally as a tuple so generated questions carry no per-instance dict.
+    
+    Only the fields relevant to the question type are set; the rest stay None.
+    Public QuizManager methods hand out plain dicts instead (see quiz_to_dict).
+    """
+    id: str
+    type: str
+    question: str
+    points: int
+    difficulty: str
+    category: str
+    options: Optional[List[str]] = None
+    correct_answer: Any = None
+    pairs: Optional[List[List[str]]] = None
+    sample_answer: Optional[str] = None
+
+
+def _question_to_dict(question: Question) -> Dict[str, Any]:
+    """Question as a dict with only the fields its type uses, as questions were originally shaped"""
+    return {field: value for field, value in zip(Question._fields, question) if value is not None}
+
+
+def quiz_to_dict(quiz: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-ready copy of a quiz, with its Question records converted to dicts"""
+    return {**quiz, "questions": [_question_to_dict(q) for q in quiz["questions"]]}
+
+
+class _ReservoirBuilder:
+    """Reservoir sample (Algorithm R) of k questions, built only when the reservoir keeps them"""
+    
+    def __init__(self, k: int, rng: random.Random):
+        self.k = k
+        self.rng = rng
+        self.seen = 0
+        self.items: List[Question] = []
+    
+    def consider(self, build: Callable[[int], Question]) -> None:
+        """Offer the next candidate; build(position) runs only if it is kept (position is 1-based)"""
+        self.seen += 1
+        if len(self.items) < self.k:
+            self.items.append(build(self.seen))
+            return
+        
+        slot = self.rng.randrange(self.seen)
+        if slot < self.k:
+            self.items[slot] = build(self.seen)
+    
+    def result(self) -> List[Question]:
+        """Kept questions in random order"""
+        self.rng.shuffle(self.items)
+        return self.items
+
+
+def _validate_multiple_choice(user_answer: Any, correct_answer: Any) -> Tuple[bool, str]:
+    is_correct = user_answer == correct_answer
+    return is_correct, "Correct!" if is_correct else f"Incorrect. The correct answer is '{correct_answer}'"
+
+
+def _validate_true_false(user_answer: Any, correct_answer: Any) -> Tuple[bool, str]:
+    is_correct = user_answer == correct_answer
+    return is_correct, "Correct!" if is_correct else f"Incorrect. The correct answer is {correct_answer}"
+
+
+def _validate_sequence(user_answer: Any, correct_answer: Any) -> Tuple[bool, str]:
+    is_correct = user_answer == correct_answer
+    return is_correct, "Correct sequence!" if is_correct else f"Incorrect order. The correct sequence is {correct_answer}"
+
+
+def _validate_open_ended(user_answer: Any, correct_answer: Any) -> Tuple[bool, str]:
+    # Always give credit for attempting an open-ended question
+    return True, "Thank you for your response! Open-ended questions help reinforce learning."
+
+
+def _validate_unsupported(user_answer: Any, correct_answer: Any) -> Tuple[bool, str]:
+    return False, ""
+
+
 class QuizManager:
     """Manages quizzes for all supported sign languages"""
     
-    def __init__(self):
-        """Initialize quiz manager with comprehensive quiz data"""
-        self.quizzes = self._generate_all_quizzes()
+    # question type -> validator(user_answer, correct_answer) -> (is_correct, feedback)
+    _VALIDATORS: Mapping[str, Callable[[Any, Any], Tuple[bool, str]]] = MappingProxyType({
+        _MULTIPLE_CHOICE: _validate_multiple_choice,
+        _TRUE_FALSE: _validate_true_false,
+        _SEQUENCE: _validate_sequence,
+        _OPEN_ENDED: _validate_open_ended,
+    })
     
-    def _generate_all_quizzes(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Generate 5 quizzes for each supported language"""
-        all_quizzes = {}
-        
-        for lang_code, lang_info in SUPPORTED_LANGUAGES.items():
-            all_quizzes[lang_code] = self._generate_language_quizzes(lang_code, lang_info)
+    def __init__(self, seed: int = 0xC0FFEE, cache_path: Optional[str] = None):
+        """Initialize quiz manager; quizzes are generated per language on first use.
+        
+        ``seed`` makes generated quiz content deterministic per language. Pass a
+        ``cache_path`` to persist the full quiz set once every language has been
+        generated, so later processes can load it instead; no file is written by default.
+        """
+        self._quiz_cache: Dict[str, List[Dict[str, Any]]] = {}
+        # quiz_id -> (quiz, {question_id: question}), extended as languages are generated
+        self._question_index: Dict[str, Tuple[Dict[str, Any], Dict[str, Question]]] = {}
+        self._cache_lock = threading.Lock()
+        # Invalidated whenever another language is generated
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        # Flattened views for get_random_quiz, also invalidated on generation
+        self._all_quizzes_flat: Optional[List[Dict[str, Any]]] = None
+        self._by_difficulty: Dict[str, List[Dict[str, Any]]] = {}
+        
+        # Generation is serialized by _cache_lock; selection uses one Random per thread
+        self._seed = seed
+        self._gen_rng = random.Random(seed)
+        self._thread_local = threading.local()
+        
+        self._cache_path = Path(cache_path) if cache_path else None
+        # Hashing the module source is only worth it when there is a disk cache to match against
+        self._cache_version = self._compute_cache_version() if self._cache_path else None
+        self._load_cache()
+    
+    @property
+    def quizzes(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Quizzes for every supported language, generating any not built yet"""
+        return {
+            lang_code: [quiz_to_dict(quiz) for quiz in quizzes]
+            for lang_code, quizzes in self._ensure_all_languages().items()
+        }
+    
+    def _ensure_all_languages(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Generate every language not built yet; returns the internal (Question-based) cache"""
+        for lang_code in SUPPORTED_LANGUAGES:
+            self._ensure_language(lang_code)
+        return self._quiz_cache
+    
+    def _ensure_language(self, lang_code: str) -> Optional[List[Dict[str, Any]]]:
+        """Get a language's quizzes, generating them on first access"""
+        quizzes = self._quiz_cache.get(lang_code)
+        if quizzes is not None:
+            return quizzes
+        
+        lang_info = SUPPORTED_LANGUAGES.get(lang_code)
+        if lang_info is None:
+            return None
         
-        return all_quizzes
+        with self._cache_lock:
+            quizzes = self._quiz_cache.get(lang_code)
+            if quizzes is None:
+                quizzes = self._generate_language_quizzes(lang_code, lang_info)
+                self._register_language(lang_code, quizzes)
+                # One write, once the set is complete; a cache loaded from disk is never rewritten
+                if len(self._quiz_cache) == len(SUPPORTED_LANGUAGES):
+                    self._save_cache()
+        return quizzes
+    
+    def _register_language(self, lang_code: str, quizzes: List[Dict[str, Any]]) -> None:
+        """Store a language's quizzes and index their questions"""
+        for quiz in quizzes:
+            self._question_index[quiz["quiz_id"]] = (
+                quiz, {q.id: q for q in quiz["questions"]}
+            )
+        self._quiz_cache[lang_code] = quizzes
+        self._stats_cache = None
+        self._all_quizzes_flat = None
+        self._by_difficulty = {}
+    
+    def _compute_cache_version(self) -> str:
+        """Fingerprint everything that determines generated content: this module, the seed and languages"""
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        digest.update(json.dumps([self._seed, SUPPORTED_LANGUAGES], sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _load_cache(self) -> None:
+        """Load previously generated quizzes from disk if the cache matches this version"""
+        if self._cache_path is None or not self._cache_path.exists():
+            return
+        
+        try:
+            raw = self._cache_path.read_bytes()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable quiz cache {self._cache_path}: {str(e)}")
+            return
+        
+        if not isinstance(data, dict) or data.get("version") != self._cache_version:
+            return
+        
+        for lang_code, quizzes in data.get("quizzes", {}).items():
+            if lang_code in SUPPORTED_LANGUAGES:
+                self._register_language(lang_code, [
+                    {**quiz, "questions": [Question(**q) for q in quiz["questions"]]}
+                    for quiz in quizzes
+                ])
+    
+    def _save_cache(self) -> None:
+        """Persist generated quizzes so later processes can skip generation"""
+        if self._cache_path is None:
+            return
+        
+        data = {
+            "version": self._cache_version,
+            "quizzes": {
+                lang_code: [quiz_to_dict(quiz) for quiz in quizzes]
+                for lang_code, quizzes in self._quiz_cache.items()
+            }
+        }
+        try:
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            
+            # Write a unique temp file then rename, so readers and other writers never see a partial file
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=str(self._cache_path.parent), prefix=self._cache_path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(payload)
+                os.replace(tmp_name, str(self._cache_path))
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write quiz cache {self._cache_path}: {str(e)}")
     
     def _generate_language_quizzes(self, lang_code: str, lang_info: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate 5 comprehensive quizzes for a specific language"""
+        # Reseed per language so content doesn't depend on which language was generated first
+        self._gen_rng.seed(f"{self._seed}:{lang_code}")
+        cultural = _CULTURAL_SIGNS.get(lang_code, _EMPTY_CULTURAL)
         base_signs = self._get_base_signs_for_language(lang_code)
         
         quizzes = [
@@ -37,482 +398,367 @@ class QuizManager:
             self._create_numbers_quiz(lang_code, lang_info, base_signs),
             self._create_family_quiz(lang_code, lang_info, base_signs),
             self._create_emotions_quiz(lang_code, lang_info, base_signs),
-            self._create_advanced_quiz(lang_code, lang_info, base_signs)
+            self._create_advanced_quiz(lang_code, lang_info, base_signs, cultural=cultural)
         ]
         
         return quizzes
     
-    def _get_base_signs_for_language(self, lang_code: str) -> Dict[str, List[str]]:
+    def _get_base_signs_for_language(self, lang_code: str) -> Mapping[str, Tuple[str, ...]]:
         """Get base vocabulary for each language with cultural adaptations"""
-        
-        # Base signs that are common across all sign languages but may have cultural variations
-        base_vocabulary = {
-            "greetings": ["hello", "goodbye", "good morning", "good evening", "nice to meet you", "how are you", "thank you", "please", "excuse me", "sorry"],
-            "numbers": ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15", "16", "17", "18", "19", "20"],
-            "family": ["mother", "father", "sister", "brother", "grandmother", "grandfather", "aunt", "uncle", "cousin", "family"],
-            "emotions": ["happy", "sad", "angry", "excited", "tired", "surprised", "worried", "calm", "confused", "proud"],
-            "colors": ["red", "blue", "green", "yellow", "black", "white", "orange", "purple", "pink", "brown"],
-            "food": ["eat", "drink", "hungry", "thirsty", "breakfast", "lunch", "dinner", "water", "milk", "bread"],
-            "time": ["today", "tomorrow", "yesterday", "morning", "afternoon", "evening", "night", "week", "month", "year"],
-            "actions": ["go", "come", "sit", "stand", "walk", "run", "sleep", "wake up", "work", "study"],
-            "places": ["home", "school", "work", "hospital", "store", "restaurant", "park", "library", "church", "city"],
-            "nature": ["sun", "moon", "star", "tree", "flower", "rain", "snow", "wind", "fire", "water"]
-        }
-        
-        # Add language-specific cultural signs
-        cultural_additions = self._get_cultural_signs(lang_code)
-        for category, signs in cultural_additions.items():
-            if category in base_vocabulary:
-                base_vocabulary[category].extend(signs)
-            else:
-                base_vocabulary[category] = signs
-        
-        return base_vocabulary
-    
-    def _get_cultural_signs(self, lang_code: str) -> Dict[str, List[str]]:
-        """Get culturally specific signs for each language"""
-        cultural_signs = {
-            "ASL": {
-                "culture": ["American", "baseball", "football", "hamburger", "democracy"],
-                "places": ["Washington DC", "New York", "California", "Texas"]
-            },
-            "BSL": {
-                "culture": ["British", "tea", "football (soccer)", "fish and chips", "queue"],
-                "places": ["London", "England", "Scotland", "Wales"]
-            },
-            "LSP": {
-                "culture": ["Portuguese", "fado", "football", "port wine", "azulejo"],
-                "places": ["Lisbon", "Porto", "Portugal", "Algarve"]
-            },
-            "LSE": {
-                "culture": ["Spanish", "flamenco", "paella", "siesta", "bullfighting"],
-                "places": ["Madrid", "Barcelona", "Spain", "Andalusia"]
-            },
-            "DGS": {
-                "culture": ["German", "beer", "sausage", "oktoberfest", "precision"],
-                "places": ["Berlin", "Munich", "Germany", "Bavaria"]
-            },
-            "LSF": {
-                "culture": ["French", "wine", "cheese", "baguette", "romance"],
-                "places": ["Paris", "Lyon", "France", "Normandy"]
-            },
-            "JSL": {
-                "culture": ["Japanese", "sushi", "origami", "bowing", "harmony"],
-                "places": ["Tokyo", "Kyoto", "Japan", "Osaka"]
-            },
-            "CSL": {
-                "culture": ["Chinese", "rice", "tea ceremony", "kung fu", "dragon"],
-                "places": ["Beijing", "Shanghai", "China", "Hong Kong"]
-            },
-            "AUSLAN": {
-                "culture": ["Australian", "kangaroo", "koala", "beach", "mate"],
-                "places": ["Sydney", "Melbourne", "Australia", "Brisbane"]
-            },
-            "NZSL": {
-                "culture": ["New Zealand", "kiwi", "rugby", "haka", "sheep"],
-                "places": ["Auckland", "Wellington", "Christchurch", "New Zealand"]
-            },
-            "ISL": {
-                "culture": ["Italian", "pasta", "pizza", "opera", "art"],
-                "places": ["Rome", "Milan", "Venice", "Italy"]
-            },
-            "RSL": {
-                "culture": ["Russian", "vodka", "ballet", "borscht", "cold"],
-                "places": ["Moscow", "St. Petersburg", "Russia", "Siberia"]
-            },
-            "LIBRAS": {
-                "culture": ["Brazilian", "carnival", "football", "capoeira", "beach"],
-                "places": ["Rio de Janeiro", "São Paulo", "Brazil", "Amazon"]
-            },
-            "LSM": {
-                "culture": ["Mexican", "tacos", "mariachi", "día de los muertos", "spicy"],
-                "places": ["Mexico City", "Guadalajara", "Mexico", "Cancun"]
-            },
-            "ISN": {
-                "culture": ["Nicaraguan", "coffee", "lakes", "volcanos", "revolution"],
-                "places": ["Managua", "León", "Nicaragua", "Granada"]
-            },
-            "VGT": {
-                "culture": ["Flemish", "waffles", "chocolate", "beer", "art"],
-                "places": ["Brussels", "Antwerp", "Belgium", "Ghent"]
-            },
-            "SSL": {
-                "culture": ["Swedish", "meatballs", "IKEA", "cold", "northern lights"],
-                "places": ["Stockholm", "Gothenburg", "Sweden", "Lapland"]
-            },
-            "NSL": {
-                "culture": ["Norwegian", "fjords", "salmon", "oil", "northern lights"],
-                "places": ["Oslo", "Bergen", "Norway", "Tromsø"]
-            },
-            "DSL": {
-                "culture": ["Danish", "hygge", "pastries", "vikings", "bicycles"],
-                "places": ["Copenhagen", "Aarhus", "Denmark", "Greenland"]
-            },
-            "FSL": {
-                "culture": ["Finnish", "sauna", "Nokia", "reindeer", "northern lights"],
-                "places": ["Helsinki", "Tampere", "Finland", "Lapland"]
-            },
-            "KSL": {
-                "culture": ["Korean", "kimchi", "k-pop", "taekwondo", "technology"],
-                "places": ["Seoul", "Busan", "South Korea", "Jeju"]
-            }
-        }
-        
-        return cultural_signs.get(lang_code, {"culture": [], "places": []})
+        return _base_signs_for_language(lang_code)
     
-    def _create_basics_quiz(self, lang_code: str, lang_info: Dict[str, Any], signs: Dict[str, List[str]]) -> Dict[str, Any]:
+    def _create_basics_quiz(self, lang_code: str, lang_info: Dict[str, Any], signs: Mapping[str, Tuple[str, ...]]) -> Dict[str, Any]:
         """Create basic greetings and common phrases quiz"""
-        questions = []
+        questions = _ReservoirBuilder(10, self._gen_rng)
         
         # Greeting questions
         greetings = signs["greetings"][:8]  # Use first 8 greetings
-        for greeting in greetings:
-            questions.append({
-                "id": f"basics_{len(questions) + 1}",
-                "type": "multiple_choice",
-                "question": f"What is the sign for '{greeting}' in {lang_info['name']}?",
-                "options": [greeting, *random.sample([g for g in greetings if g != greeting], 3)],
-                "correct_answer": greeting,
-                "points": 10,
-                "difficulty": "Easy",
-                "category": "greetings"
-            })
+        for i, greeting in enumerate(greetings):
+            questions.consider(lambda n: Question(
+                id="basics_" + str(n),
+                type=_MULTIPLE_CHOICE,
+                question=f"What is the sign for '{greeting}' in {lang_info['name']}?",
+                options=_distractors(greetings, i, 3, self._gen_rng),
+                correct_answer=greeting,
+                points=10,
+                difficulty=_EASY,
+                category="greetings"
+            ))
         
         # Color questions
         colors = signs["colors"][:7]  # Use first 7 colors
-        for color in colors:
-            questions.append({
-                "id": f"basics_{len(questions) + 1}",
-                "type": "multiple_choice",
-                "question": f"How do you sign '{color}' in {lang_info['name']}?",
-                "options": [color, *random.sample([c for c in colors if c != color], 3)],
-                "correct_answer": color,
-                "points": 10,
-                "difficulty": "Easy",
-                "category": "colors"
-            })
-        
-        return {
-            "quiz_id": f"{lang_code}_basics",
-            "title": f"{lang_info['name']} - Basic Signs",
-            "description": f"Test your knowledge of basic greetings and common signs in {lang_info['name']}",
-            "language": lang_code,
-            "difficulty": "Easy",
-            "estimated_time": 10,
-            "total_questions": len(questions),
-            "total_points": sum(q["points"] for q in questions),
-            "questions": random.sample(questions, min(10, len(questions)))
-        }
+        for i, color in enumerate(colors):
+            questions.consider(lambda n: Question(
+                id="basics_" + str(n),
+                type=_MULTIPLE_CHOICE,
+                question=f"How do you sign '{color}' in {lang_info['name']}?",
+                options=_distractors(colors, i, 3, self._gen_rng),
+                correct_answer=color,
+                points=10,
+                difficulty=_EASY,
+                category="colors"
+            ))
+        
+        return self._finalize_quiz(
+            quiz_id=f"{lang_code}_basics",
+            title=f"{lang_info['name']} - Basic Signs",
+            description=f"Test your knowledge of basic greetings and common signs in {lang_info['name']}",
+            language=lang_code,
+            difficulty=_EASY,
+            estimated_time=10,
+            questions=questions.result()
+        )
     
-    def _create_numbers_quiz(self, lang_code: str, lang_info: Dict[str, Any], signs: Dict[str, List[str]]) -> Dict[str, Any]:
+    def _create_numbers_quiz(self, lang_code: str, lang_info: Dict[str, Any], signs: Mapping[str, Tuple[str, ...]]) -> Dict[str, Any]:
         """Create numbers and counting quiz"""
-        questions = []
+        questions = _ReservoirBuilder(10, self._gen_rng)
         numbers = signs["numbers"]
         
         # Number recognition
-        for num in numbers[:15]:  # Use numbers 1-15
-            wrong_answers = random.sample([n for n in numbers if n != num], 3)
-            questions.append({
-                "id": f"numbers_{len(questions) + 1}",
-                "type": "multiple_choice",
-                "question": f"What number is being signed? (Number: {num})",
-                "options": [num, *wrong_answers],
-                "correct_answer": num,
-                "points": 10,
-                "difficulty": "Easy",
-                "category": "numbers"
-            })
+        for i, num in enumerate(numbers[:15]):  # Use numbers 1-15
+            questions.consider(lambda n: Question(
+                id="numbers_" + str(n),
+                type=_MULTIPLE_CHOICE,
+                question=f"What number is being signed? (Number: {num})",
+                options=_distractors(numbers, i, 3, self._gen_rng),
+                correct_answer=num,
+                points=10,
+                difficulty=_EASY,
+                category="numbers"
+            ))
         
         # Number sequences
-        questions.append({
-            "id": f"numbers_{len(questions) + 1}",
-            "type": "sequence",
-            "question": f"Put these numbers in order as they would be signed in {lang_info['name']}:",
-            "options": ["3", "1", "4", "2"],
-            "correct_answer": ["1", "2", "3", "4"],
-            "points": 20,
-            "difficulty": "Medium",
-            "category": "number_sequence"
-        })
-        
-        return {
-            "quiz_id": f"{lang_code}_numbers",
-            "title": f"{lang_info['name']} - Numbers & Counting",
-            "description": f"Test your number signing skills in {lang_info['name']}",
-            "language": lang_code,
-            "difficulty": "Easy",
-            "estimated_time": 8,
-            "total_questions": len(questions),
-            "total_points": sum(q["points"] for q in questions),
-            "questions": random.sample(questions, min(10, len(questions)))
-        }
+        questions.consider(lambda n: Question(
+            id="numbers_" + str(n),
+            type=_SEQUENCE,
+            question=f"Put these numbers in order as they would be signed in {lang_info['name']}:",
+            options=["3", "1", "4", "2"],
+            correct_answer=["1", "2", "3", "4"],
+            points=20,
+            difficulty=_MEDIUM,
+            category="number_sequence"
+        ))
+        
+        return self._finalize_quiz(
+            quiz_id=f"{lang_code}_numbers",
+            title=f"{lang_info['name']} - Numbers & Counting",
+            description=f"Test your number signing skills in {lang_info['name']}",
+            language=lang_code,
+            difficulty=_EASY,
+            estimated_time=8,
+            questions=questions.result()
+        )
     
-    def _create_family_quiz(self, lang_code: str, lang_info: Dict[str, Any], signs: Dict[str, List[str]]) -> Dict[str, Any]:
+    def _create_family_quiz(self, lang_code: str, lang_info: Dict[str, Any], signs: Mapping[str, Tuple[str, ...]]) -> Dict[str, Any]:
         """Create family relationships quiz"""
-        questions = []
+        questions = _ReservoirBuilder(12, self._gen_rng)
         family_signs = signs["family"]
         
-        for family_member in family_signs:
-            wrong_answers = random.sample([f for f in family_signs if f != family_member], 3)
-            questions.append({
-                "id": f"family_{len(questions) + 1}",
-                "type": "multiple_choice",
-                "question": f"How do you sign '{family_member}' in {lang_info['name']}?",
-                "options": [family_member, *wrong_answers],
-                "correct_answer": family_member,
-                "points": 15,
-                "difficulty": "Medium",
-                "category": "family"
-            })
+        for i, family_member in enumerate(family_signs):
+            questions.consider(lambda n: Question(
+                id="family_" + str(n),
+                type=_MULTIPLE_CHOICE,
+                question=f"How do you sign '{family_member}' in {lang_info['name']}?",
+                options=_distractors(family_signs, i, 3, self._gen_rng),
+                correct_answer=family_member,
+                points=15,
+                difficulty=_MEDIUM,
+                category="family"
+            ))
         
         # Relationship questions
-        questions.append({
-            "id": f"family_{len(questions) + 1}",
-            "type": "true_false",
-            "question": f"In {lang_info['name']}, family signs often use specific hand shapes near the face.",
-            "correct_answer": True,
-            "points": 10,
-            "difficulty": "Medium",
-            "category": "family_structure"
-        })
-        
-        return {
-            "quiz_id": f"{lang_code}_family",
-            "title": f"{lang_info['name']} - Family & Relationships",
-            "description": f"Learn family relationship signs in {lang_info['name']}",
-            "language": lang_code,
-            "difficulty": "Medium",
-            "estimated_time": 12,
-            "total_questions": len(questions),
-            "total_points": sum(q["points"] for q in questions),
-            "questions": random.sample(questions, min(12, len(questions)))
-        }
+        questions.consider(lambda n: Question(
+            id="family_" + str(n),
+            type=_TRUE_FALSE,
+            question=f"In {lang_info['name']}, family signs often use specific hand shapes near the face.",
+            correct_answer=True,
+            points=10,
+            difficulty=_MEDIUM,
+            category="family_structure"
+        ))
+        
+        return self._finalize_quiz(
+            quiz_id=f"{lang_code}_family",
+            title=f"{lang_info['name']} - Family & Relationships",
+            description=f"Learn family relationship signs in {lang_info['name']}",
+            language=lang_code,
+            difficulty=_MEDIUM,
+            estimated_time=12,
+            questions=questions.result()
+        )
     
-    def _create_emotions_quiz(self, lang_code: str, lang_info: Dict[str, Any], signs: Dict[str, List[str]]) -> Dict[str, Any]:
+    def _create_emotions_quiz(self, lang_code: str, lang_info: Dict[str, Any], signs: Mapping[str, Tuple[str, ...]]) -> Dict[str, Any]:
         """Create emotions and feelings quiz"""
-        questions = []
+        questions = _ReservoirBuilder(12, self._gen_rng)
         emotions = signs["emotions"]
         
-        for emotion in emotions:
-            wrong_answers = random.sample([e for e in emotions if e != emotion], 3)
-            questions.append({
-                "id": f"emotions_{len(questions) + 1}",
-                "type": "multiple_choice",
-                "question": f"What emotion is being expressed: '{emotion}' in {lang_info['name']}?",
-                "options": [emotion, *wrong_answers],
-                "correct_answer": emotion,
-                "points": 15,
-                "difficulty": "Medium",
-                "category": "emotions"
-            })
+        for i, emotion in enumerate(emotions):
+            questions.consider(lambda n: Question(
+                id="emotions_" + str(n),
+                type=_MULTIPLE_CHOICE,
+                question=f"What emotion is being expressed: '{emotion}' in {lang_info['name']}?",
+                options=_distractors(emotions, i, 3, self._gen_rng),
+                correct_answer=emotion,
+                points=15,
+                difficulty=_MEDIUM,
+                category="emotions"
+            ))
         
         # Emotional expression questions
-        questions.append({
-            "id": f"emotions_{len(questions) + 1}",
-            "type": "matching",
-            "question": f"Match the emotion with its typical facial expression in {lang_info['name']}:",
-            "pairs": [
+        questions.consider(lambda n: Question(
+            id="emotions_" + str(n),
+            type=_MATCHING,
+            question=f"Match the emotion with its typical facial expression in {lang_info['name']}:",
+            pairs=[
                 ["happy", "smiling"],
                 ["sad", "frowning"],
                 ["angry", "intense expression"],
                 ["surprised", "wide eyes"]
             ],
-            "points": 20,
-            "difficulty": "Medium",
-            "category": "emotional_expression"
-        })
-        
-        return {
-            "quiz_id": f"{lang_code}_emotions",
-            "title": f"{lang_info['name']} - Emotions & Feelings",
-            "description": f"Express emotions and feelings in {lang_info['name']}",
-            "language": lang_code,
-            "difficulty": "Medium",
-            "estimated_time": 15,
-            "total_questions": len(questions),
-            "total_points": sum(q["points"] for q in questions),
-            "questions": random.sample(questions, min(12, len(questions)))
-        }
+            points=20,
+            difficulty=_MEDIUM,
+            category="emotional_expression"
+        ))
+        
+        return self._finalize_quiz(
+            quiz_id=f"{lang_code}_emotions",
+            title=f"{lang_info['name']} - Emotions & Feelings",
+            description=f"Express emotions and feelings in {lang_info['name']}",
+            language=lang_code,
+            difficulty=_MEDIUM,
+            estimated_time=15,
+            questions=questions.result()
+        )
     
-    def _create_advanced_quiz(self, lang_code: str, lang_info: Dict[str, Any], signs: Dict[str, List[str]]) -> Dict[str, Any]:
+    def _create_advanced_quiz(self, lang_code: str, lang_info: Dict[str, Any], signs: Mapping[str, Tuple[str, ...]],
+                              *, cultural: Mapping[str, Tuple[str, ...]]) -> Dict[str, Any]:
         """Create advanced vocabulary and grammar quiz"""
-        questions = []
+        questions = _ReservoirBuilder(15, self._gen_rng)
+        
+        # Distractors come from the whole vocabulary; dedupe so a sign listed in
+        # two categories (e.g. "water") can't show up as its own wrong answer
+        all_signs = tuple(dict.fromkeys(s for category in signs.values() for s in category))
+        sign_to_idx = {s: idx for idx, s in enumerate(all_signs)}
         
         # Complex vocabulary
         advanced_signs = signs["actions"] + signs["places"] + signs["time"]
         for sign in advanced_signs[:15]:  # Use first 15 advanced signs
-            category_signs = [s for category in signs.values() for s in category if s != sign]
-            wrong_answers = random.sample(category_signs, 3)
-            
-            questions.append({
-                "id": f"advanced_{len(questions) + 1}",
-                "type": "multiple_choice",
-                "question": f"What is the advanced sign for '{sign}' in {lang_info['name']}?",
-                "options": [sign, *wrong_answers],
-                "correct_answer": sign,
-                "points": 20,
-                "difficulty": "Hard",
-                "category": "advanced_vocabulary"
-            })
+            questions.consider(lambda n: Question(
+                id="advanced_" + str(n),
+                type=_MULTIPLE_CHOICE,
+                question=f"What is the advanced sign for '{sign}' in {lang_info['name']}?",
+                options=_distractors(all_signs, sign_to_idx[sign], 3, self._gen_rng),
+                correct_answer=sign,
+                points=20,
+                difficulty=_HARD,
+                category="advanced_vocabulary"
+            ))
         
         # Grammar and structure questions
-        questions.append({
-            "id": f"advanced_{len(questions) + 1}",
-            "type": "true_false",
-            "question": f"In {lang_info['name']}, facial expressions are crucial for grammatical meaning.",
-            "correct_answer": True,
-            "points": 25,
-            "difficulty": "Hard",
-            "category": "grammar"
-        })
-        
-        questions.append({
-            "id": f"advanced_{len(questions) + 1}",
-            "type": "true_false",
-            "question": f"{lang_info['name']} uses a different word order than spoken {lang_info['name'].replace(' Sign Language', '')} language.",
-            "correct_answer": True,
-            "points": 25,
-            "difficulty": "Hard",
-            "category": "grammar"
-        })
+        questions.consider(lambda n: Question(
+            id="advanced_" + str(n),
+            type=_TRUE_FALSE,
+            question=f"In {lang_info['name']}, facial expressions are crucial for grammatical meaning.",
+            correct_answer=True,
+            points=25,
+            difficulty=_HARD,
+            category="grammar"
+        ))
+        
+        questions.consider(lambda n: Question(
+            id="advanced_" + str(n),
+            type=_TRUE_FALSE,
+            question=f"{lang_info['name']} uses a different word order than spoken {lang_info['name'].replace(' Sign Language', '')} language.",
+            correct_answer=True,
+            points=25,
+            difficulty=_HARD,
+            category="grammar"
+        ))
         
         # Cultural context
-        cultural_signs = self._get_cultural_signs(lang_code).get("culture", [])
+        cultural_signs = cultural.get("culture", ())
         if cultural_signs:
-            cultural_sign = random.choice(cultural_signs)
-            questions.append({
-                "id": f"advanced_{len(questions) + 1}",
-                "type": "open_ended",
-                "question": f"Describe the cultural significance of the sign '{cultural_sign}' in {lang_info['name']}.",
-                "sample_answer": f"The sign '{cultural_sign}' represents an important cultural element in {lang_info['country']} and reflects the deaf community's connection to their heritage.",
-                "points": 30,
-                "difficulty": "Hard",
-                "category": "cultural_context"
-            })
+            cultural_sign = self._gen_rng.choice(cultural_signs)
+            questions.consider(lambda n: Question(
+                id="advanced_" + str(n),
+                type=_OPEN_ENDED,
+                question=f"Describe the cultural significance of the sign '{cultural_sign}' in {lang_info['name']}.",
+                sample_answer=f"The sign '{cultural_sign}' represents an important cultural element in {lang_info['country']} and reflects the deaf community's connection to their heritage.",
+                points=30,
+                difficulty=_HARD,
+                category="cultural_context"
+            ))
+        
+        return self._finalize_quiz(
+            quiz_id=f"{lang_code}_advanced",
+            title=f"{lang_info['name']} - Advanced Concepts",
+            description=f"Challenge yourself with advanced {lang_info['name']} concepts and cultural context",
+            language=lang_code,
+            difficulty=_HARD,
+            estimated_time=20,
+            questions=questions.result()
+        )
+    
+    def _finalize_quiz(self, *, quiz_id: str, title: str, description: str, language: str,
+                       difficulty: str, estimated_time: int,
+                       questions: List[Question]) -> Dict[str, Any]:
+        """Build the quiz metadata around the questions shown to the user"""
+        total_points = 0
+        for q in questions:
+            total_points += q.points
         
         return {
-            "quiz_id": f"{lang_code}_advanced",
-            "title": f"{lang_info['name']} - Advanced Concepts",
-            "description": f"Challenge yourself with advanced {lang_info['name']} concepts and cultural context",
-            "language": lang_code,
-            "difficulty": "Hard",
-            "estimated_time": 20,
+            "quiz_id": quiz_id,
+            "title": title,
+            "description": description,
+            "language": language,
+            "difficulty": difficulty,
+            "estimated_time": estimated_time,
             "total_questions": len(questions),
-            "total_points": sum(q["points"] for q in questions),
-            "questions": random.sample(questions, min(15, len(questions)))
+            "total_points": total_points,
+            "questions": questions
         }
     
     def get_quiz(self, language: str, quiz_type: str) -> Optional[Dict[str, Any]]:
         """Get a specific quiz for a language"""
-        if language not in self.quizzes:
+        quizzes = self._ensure_language(language)
+        if quizzes is None:
             return None
         
-        quiz_mapping = {
-            "basics": 0,
-            "numbers": 1,
-            "family": 2,
-            "emotions": 3,
-            "advanced": 4
-        }
-        
-        quiz_index = quiz_mapping.get(quiz_type)
-        if quiz_index is None or quiz_index >= len(self.quizzes[language]):
+        quiz_index = _QUIZ_TYPE_INDEX.get(quiz_type)
+        if quiz_index is None or quiz_index >= len(quizzes):
             return None
         
-        return self.quizzes[language][quiz_index]
+        return quiz_to_dict(quizzes[quiz_index])
     
     def get_all_quizzes_for_language(self, language: str) -> List[Dict[str, Any]]:
         """Get all quizzes for a specific language"""
-        return self.quizzes.get(language, [])
+        return [quiz_to_dict(quiz) for quiz in self._ensure_language(language) or []]
+    
+    def _get_rng(self) -> random.Random:
+        """Get the Random instance bound to the calling thread"""
+        rng = getattr(self._thread_local, "rng", None)
+        if rng is None:
+            rng = self._thread_local.rng = random.Random()
+        return rng
     
-    def get_random_quiz(self, language: str = None, difficulty: str = None) -> Optional[Dict[str, Any]]:
-        """Get a random quiz, optionally filtered by language and difficulty"""
-        available_quizzes = []
+    def get_random_quiz(self, language: str = None, difficulty: str = None,
+                        rng: Optional[random.Random] = None) -> Optional[Dict[str, Any]]:
+        """Get a random quiz, optionally filtered by language and difficulty.
         
+        Pass a seeded ``rng`` to get a reproducible pick.
+        """
         if language:
-            if language in self.quizzes:
-                available_quizzes = self.quizzes[language]
+            available_quizzes = self._ensure_language(language) or []
+            if difficulty:
+                available_quizzes = [q for q in available_quizzes if q["difficulty"] == difficulty]
         else:
-            for lang_quizzes in self.quizzes.values():
-                available_quizzes.extend(lang_quizzes)
-        
-        if difficulty:
-            available_quizzes = [q for q in available_quizzes if q["difficulty"] == difficulty]
+            if self._all_quizzes_flat is None:
+                self._build_flat_quizzes()
+            if difficulty:
+                available_quizzes = self._by_difficulty.get(difficulty, [])
+            else:
+                available_quizzes = self._all_quizzes_flat or []
         
         if not available_quizzes:
             return None
         
-        return random.choice(available_quizzes)
+        return quiz_to_dict((rng or self._get_rng()).choice(available_quizzes))
+    
+    def _build_flat_quizzes(self) -> None:
+        """Flatten every language's quizzes once, grouped by difficulty as well"""
+        all_quizzes = [quiz for lang_quizzes in self._ensure_all_languages().values() for quiz in lang_quizzes]
+        by_difficulty: Dict[str, List[Dict[str, Any]]] = {}
+        for quiz in all_quizzes:
+            by_difficulty.setdefault(quiz["difficulty"], []).append(quiz)
+        
+        self._by_difficulty = by_difficulty
+        self._all_quizzes_flat = all_quizzes
     
     def get_quiz_statistics(self) -> Dict[str, Any]:
         """Get overall quiz statistics"""
-        total_quizzes = sum(len(quizzes) for quizzes in self.quizzes.values())
-        
-        difficulty_counts = {"Easy": 0, "Medium": 0, "Hard": 0}
-        total_questions = 0
-        
-        for lang_quizzes in self.quizzes.values():
-            for quiz in lang_quizzes:
-                difficulty_counts[quiz["difficulty"]] += 1
-                total_questions += quiz["total_questions"]
+        if self._stats_cache is None:
+            quizzes = self._ensure_all_languages()
+            all_quizzes = [quiz for lang_quizzes in quizzes.values() for quiz in lang_quizzes]
+            total_quizzes = len(all_quizzes)
+            
+            difficulty_counts = {_EASY: 0, _MEDIUM: 0, _HARD: 0}
+            difficulty_counts.update(Counter(quiz["difficulty"] for quiz in all_quizzes))
+            total_questions = sum(quiz["total_questions"] for quiz in all_quizzes)
+            
+            self._stats_cache = {
+                "total_languages": len(quizzes),
+                "total_quizzes": total_quizzes,
+                "quizzes_per_language": 5,
+                "total_questions": total_questions,
+                "difficulty_distribution": difficulty_counts,
+                "average_questions_per_quiz": round(total_questions / total_quizzes, 1)
+            }
         
-        return {
-            "total_languages": len(self.quizzes),
-            "total_quizzes": total_quizzes,
-            "quizzes_per_language": 5,
-            "total_questions": total_questions,
-            "difficulty_distribution": difficulty_counts,
-            "average_questions_per_quiz": round(total_questions / total_quizzes, 1)
-        }
+        # Hand out a copy so a caller's edits can't leak into the cached figures
+        stats = self._stats_cache
+        return {**stats, "difficulty_distribution": dict(stats["difficulty_distribution"])}
     
     def validate_quiz_answer(self, quiz_id: str, question_id: str, user_answer: Any) -> Dict[str, Any]:
         """Validate a user's answer to a quiz question"""
-        # Find the quiz and question
-        quiz = None
-        question = None
-        
-        for lang_quizzes in self.quizzes.values():
-            for q in lang_quizzes:
-                if q["quiz_id"] == quiz_id:
-                    quiz = q
-                    for quest in q["questions"]:
-                        if quest["id"] == question_id:
-                            question = quest
-                            break
-                    break
-            if quiz:
-                break
-        
-        if not quiz or not question:
-            return {"error": "Quiz or question not found"}
-        
-        correct_answer = question["correct_answer"]
-        is_correct = False
-        feedback = ""
+        # Quiz ids are "<language>_<type>", so only that language needs generating
+        self._ensure_language(quiz_id.rpartition("_")[0])
         
-        if question["type"] == "multiple_choice":
-            is_correct = user_answer == correct_answer
-            feedback = "Correct!" if is_correct else f"Incorrect. The correct answer is '{correct_answer}'"
-        
-        elif question["type"] == "true_false":
-            is_correct = user_answer == correct_answer
-            feedback = "Correct!" if is_correct else f"Incorrect. The correct answer is {correct_answer}"
-        
-        elif question["type"] == "sequence":
-            is_correct = user_answer == correct_answer
-            feedback = "Correct sequence!" if is_correct else f"Incorrect order. The correct sequence is {correct_answer}"
+        entry = self._question_index.get(quiz_id)
+        question = entry[1].get(question_id) if entry else None
+        if question is None:
+            return {"error": "Quiz or question not found"}
         
-        elif question["type"] == "open_ended":
-            # For open-ended questions, we'll give partial credit based on keywords
-            is_correct = True  # Always give credit for attempting
-            feedback = "Thank you for your response! Open-ended questions help reinforce learning."
+        correct_answer = question.correct_answer
+        validator = self._VALIDATORS.get(question.type, _validate_unsupported)
+        is_correct, feedback = validator(user_answer, correct_answer)
         
-        points_earned = question["points"] if is_correct else 0
+        points_earned = question.points if is_correct else 0
         
         return {
             "is_correct": is_correct,
             "points_earned": points_earned,
-            "max_points": question["points"],
+            "max_points": question.points,
             "feedback": feedback,
             "correct_answer": correct_answer
         }
@@ -3,10 +3,13 @@ Real-time Quiz System for Sign Language Learning
 Handles timed quizzes, scoring, and progress tracking
 """
 
+import bisect
 import time
+from array import array
 import random
 import json
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 import logging
 import streamlit as st
@@ -14,6 +17,100 @@ from .quiz_database import QuizDatabase
 
 logger = logging.getLogger(__name__)
 
+# Lower bounds (inclusive) of each band; label/bonus i+1 applies from threshold i upward
+_GRADE_THRESHOLDS = (60, 65, 70, 75, 80, 85, 90, 95)
+_GRADE_LABELS = ("F", "D", "D+", "C", "C+", "B", "B+", "A", "A+")
+_ACCURACY_BONUS_THRESHOLDS = (80, 90, 95)
+_ACCURACY_BONUSES = (0, 20, 30, 50)
+
+# Static feedback payloads, shared by every attempt and result; treat as read-only
+_FEEDBACK_EXCELLENT = {
+    "type": "excellent",
+    "message": "🎉 Excellent! Perfect sign recognition!",
+    "color": "success"
+}
+_FEEDBACK_GOOD = {
+    "type": "good",
+    "message": "✅ Good job! Sign recognized correctly.",
+    "color": "success"
+}
+_FEEDBACK_LOW_CONFIDENCE = {
+    "type": "low_confidence",
+    "message": "❌ Sign not clearly detected. Please adjust your position and try again.",
+    "color": "error"
+}
+_WRONG_SIGN_MESSAGE = "❌ Incorrect. Expected '{sign}', got '{predicted}'."
+
+_FINAL_FEEDBACK_OUTSTANDING = {
+    "title": "🏆 Outstanding Performance!",
+    "message": "You've mastered these signs with exceptional accuracy!",
+    "color": "success"
+}
+_FINAL_FEEDBACK_EXCELLENT = {
+    "title": "🎉 Excellent Work!",
+    "message": "Great job! You're showing strong progress in sign language.",
+    "color": "success"
+}
+_FINAL_FEEDBACK_PASSED = {
+    "title": "✅ Well Done!",
+    "message": "You passed! Keep practicing to improve your accuracy.",
+    "color": "success"
+}
+_FINAL_FEEDBACK_FAILED = {
+    "title": "📚 Keep Practicing!",
+    "message": "Don't worry! Practice makes perfect. Review the signs and try again.",
+    "color": "warning"
+}
+
+# "MM:SS" for every second of the first hour, so the countdown never formats per frame
+_MMSS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(3601))
+
+class _AttemptLog:
+    """Quiz attempts stored column-wise instead of one dict per attempt"""
+    
+    __slots__ = ("sign", "predicted", "confidence", "is_correct", "timestamp", "time_taken", "skipped")
+    
+    def __init__(self):
+        self.sign: List[str] = []
+        self.predicted: List[str] = []
+        self.confidence = array("d")
+        self.is_correct = bytearray()
+        self.timestamp = array("d")  # epoch seconds, formatted only when exported
+        self.time_taken = array("d")
+        self.skipped = bytearray()
+    
+    def __len__(self) -> int:
+        return len(self.sign)
+    
+    def append(self, sign: str, predicted: str, confidence: float, is_correct: bool,
+               time_taken: float, skipped: bool = False) -> None:
+        """Record one attempt"""
+        self.sign.append(sign)
+        self.predicted.append(predicted)
+        self.confidence.append(confidence)
+        self.is_correct.append(is_correct)
+        self.timestamp.append(time.time())
+        self.time_taken.append(time_taken)
+        self.skipped.append(skipped)
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Attempts as a list of dicts, the shape used in quiz results"""
+        attempts = []
+        for i in range(len(self.sign)):
+            attempt = {
+                "sign": self.sign[i],
+                "predicted": self.predicted[i],
+                "confidence": self.confidence[i],
+                "is_correct": bool(self.is_correct[i]),
+                "timestamp": datetime.fromtimestamp(self.timestamp[i]).isoformat(),
+                "time_taken": self.time_taken[i]
+            }
+            if self.skipped[i]:
+                attempt["skipped"] = True
+            attempts.append(attempt)
+        return attempts
+
+
 class QuizSystem:
     """Real-time quiz system for sign language learning"""
     
@@ -25,6 +122,23 @@ class QuizSystem:
         self.quiz_results = []
         self.quiz_active = False
         self.quiz_database = QuizDatabase()
+        # Lowercased current target sign, refreshed only when the sign index moves
+        self._current_sign_lower: Optional[str] = None
+        # ((sign index, score, whole seconds remaining), progress dict) from the last call
+        self._progress_cache: Optional[Tuple[Tuple[int, int, int], Dict[str, Any]]] = None
+        
+        # Fixed for the lifetime of a quiz, set by start_quiz; timing is time.monotonic() seconds
+        self._total_signs = 0
+        self._duration = 0
+        self._passing_score = 0
+        self._difficulty = ""
+        self._start_ts = 0.0
+        self._end_ts = 0.0
+        self._pause_ts: Optional[float] = None
+        
+        # (language, quiz type) -> questions shuffled once and drawn across consecutive quizzes
+        self._question_queues: Dict[Tuple[str, str], deque] = {}
+        self._rng = random.Random()
         
         # Quiz configurations
         self.quiz_configs = {
@@ -62,13 +176,9 @@ class QuizSystem:
             
             config = self.quiz_configs[quiz_type]
             
-            # Get questions from database based on quiz type and language
-            if quiz_type == "practice":
-                quiz_questions = self.quiz_database.get_practice_questions(config["signs_count"])
-            else:
-                quiz_questions = self.quiz_database.get_quiz_questions(
-                    language, quiz_type, config["signs_count"]
-                )
+            # Get questions from database based on quiz type and language, as plain
+            # dicts so quiz state stays JSON-serializable and picklable
+            quiz_questions = [dict(q) for q in self._draw_questions(language, quiz_type, config["signs_count"])]
             
             # Extract signs from questions
             quiz_signs = [q["sign"] for q in quiz_questions]
@@ -78,16 +188,25 @@ class QuizSystem:
                 "language": language,
                 "config": config,
                 "signs": quiz_signs,
+                "signs_lower": [sign.lower() for sign in quiz_signs],
                 "questions": quiz_questions,
                 "current_sign_index": 0,
-                "start_time": datetime.now(),
-                "end_time": datetime.now() + timedelta(seconds=config["duration"]),
                 "score": 0,
-                "attempts": [],
+                "attempts": _AttemptLog(),
                 "completed": False,
                 "time_remaining": config["duration"]
             }
             
+            self._current_sign_lower = self.current_quiz["signs_lower"][0] if quiz_signs else None
+            self._progress_cache = None
+            self._total_signs = len(quiz_signs)
+            self._duration = config["duration"]
+            self._passing_score = config["passing_score"]
+            self._difficulty = config["difficulty"]
+            # Monotonic seconds; cheaper than datetime arithmetic per frame
+            self._start_ts = time.monotonic()
+            self._end_ts = self._start_ts + self._duration
+            self._pause_ts = None
             self.quiz_active = True
             logger.info(f"Started {quiz_type} quiz for {language} with {len(quiz_signs)} signs")
             
@@ -95,7 +214,7 @@ class QuizSystem:
                 "success": True,
                 "quiz_id": f"{quiz_type}_{language}_{int(time.time())}",
                 "duration": config["duration"],
-                "signs_count": len(quiz_signs),
+                "signs_count": self._total_signs,
                 "first_sign": quiz_signs[0] if quiz_signs else None,
                 "questions": quiz_questions
             }
@@ -104,12 +223,34 @@ class QuizSystem:
             logger.error(f"Error starting quiz: {str(e)}")
             return {"error": str(e)}
     
+    def _draw_questions(self, language: str, quiz_type: str, count: int) -> List[Dict[str, Any]]:
+        """Take the next questions from the quiz type's shuffled queue, refilling it when short.
+        
+        Questions don't repeat until the whole pool has been used, within or across quizzes.
+        """
+        if quiz_type == "practice":
+            pool = self.quiz_database.get_practice_pool()
+        else:
+            pool = self.quiz_database.get_question_pool(language, quiz_type)
+        count = min(count, len(pool))
+        
+        queue = self._question_queues.setdefault((language, quiz_type), deque())
+        if len(queue) < count:
+            # Leftovers go first; the refill puts them last so this quiz has no duplicates
+            leftover_ids = {id(q) for q in queue}
+            refill = list(pool)
+            self._rng.shuffle(refill)
+            queue.extend(q for q in refill if id(q) not in leftover_ids)
+            queue.extend(q for q in refill if id(q) in leftover_ids)
+        
+        return [queue.popleft() for _ in range(count)]
+    
     def get_current_sign(self) -> Optional[str]:
         """Get the current sign to practice"""
         if not self.quiz_active or not self.current_quiz:
             return None
         
-        if self.current_quiz["current_sign_index"] < len(self.current_quiz["signs"]):
+        if self.current_quiz["current_sign_index"] < self._total_signs:
             return self.current_quiz["signs"][self.current_quiz["current_sign_index"]]
         
         return None
@@ -123,42 +264,37 @@ class QuizSystem:
         if not current_sign:
             return {"error": "No current sign"}
         
+        now_ts = time.monotonic()
+        
         # Check if time is up
-        if datetime.now() > self.current_quiz["end_time"]:
+        if now_ts > self._end_ts:
             self.end_quiz()
             return {"error": "Quiz time expired"}
         
         # Validate the sign
-        is_correct = predicted_sign.lower() == current_sign.lower()
         min_confidence = 0.7  # Minimum confidence for acceptance
+        is_correct = predicted_sign.lower() == self._current_sign_lower and confidence >= min_confidence
         
-        attempt_result = {
-            "sign": current_sign,
-            "predicted": predicted_sign,
-            "confidence": confidence,
-            "is_correct": is_correct and confidence >= min_confidence,
-            "timestamp": datetime.now().isoformat(),
-            "time_taken": (datetime.now() - self.current_quiz["start_time"]).total_seconds()
-        }
-        
-        self.current_quiz["attempts"].append(attempt_result)
+        self.current_quiz["attempts"].append(
+            current_sign, predicted_sign, confidence, is_correct, now_ts - self._start_ts
+        )
         
         result = {
-            "is_correct": attempt_result["is_correct"],
+            "is_correct": is_correct,
             "confidence": confidence,
             "current_sign": current_sign,
             "predicted_sign": predicted_sign,
-            "feedback": self._get_feedback(attempt_result),
-            "progress": self._get_quiz_progress()
+            "feedback": self._get_feedback(is_correct, confidence, current_sign, predicted_sign),
+            "progress": self._get_quiz_progress(now_ts)
         }
         
         # If correct, move to next sign
-        if attempt_result["is_correct"]:
+        if is_correct:
             self.current_quiz["score"] += 1
-            self.current_quiz["current_sign_index"] += 1
+            self._advance_sign()
             
             # Check if quiz is complete
-            if self.current_quiz["current_sign_index"] >= len(self.current_quiz["signs"]):
+            if self.current_quiz["current_sign_index"] >= self._total_signs:
                 self.end_quiz()
                 result["quiz_completed"] = True
                 result["final_results"] = self.get_quiz_results()
@@ -167,59 +303,60 @@ class QuizSystem:
         
         return result
     
-    def _get_feedback(self, attempt: Dict[str, Any]) -> Dict[str, str]:
+    def _advance_sign(self) -> None:
+        """Move to the next sign and refresh the cached lowercase target"""
+        index = self.current_quiz["current_sign_index"] + 1
+        self.current_quiz["current_sign_index"] = index
+        self._current_sign_lower = self.current_quiz["signs_lower"][index] if index < self._total_signs else None
+    
+    def _get_feedback(self, is_correct: bool, confidence: float, sign: str, predicted: str) -> Dict[str, str]:
         """Generate feedback for an attempt"""
-        if attempt["is_correct"]:
-            if attempt["confidence"] >= 0.9:
-                return {
-                    "type": "excellent",
-                    "message": "🎉 Excellent! Perfect sign recognition!",
-                    "color": "success"
-                }
-            else:
-                return {
-                    "type": "good",
-                    "message": "✅ Good job! Sign recognized correctly.",
-                    "color": "success"
-                }
-        else:
-            if attempt["confidence"] < 0.3:
-                return {
-                    "type": "low_confidence",
-                    "message": "❌ Sign not clearly detected. Please adjust your position and try again.",
-                    "color": "error"
-                }
-            else:
-                return {
-                    "type": "wrong_sign",
-                    "message": f"❌ Incorrect. Expected '{attempt['sign']}', got '{attempt['predicted']}'.",
-                    "color": "error"
-                }
+        if is_correct:
+            return _FEEDBACK_EXCELLENT if confidence >= 0.9 else _FEEDBACK_GOOD
+        if confidence < 0.3:
+            return _FEEDBACK_LOW_CONFIDENCE
+        return {
+            "type": "wrong_sign",
+            "message": _WRONG_SIGN_MESSAGE.format(sign=sign, predicted=predicted),
+            "color": "error"
+        }
     
-    def _get_quiz_progress(self) -> Dict[str, Any]:
-        """Get current quiz progress"""
+    def _get_quiz_progress(self, now_ts: Optional[float] = None) -> Dict[str, Any]:
+        """Get current quiz progress; ``now_ts`` is a time.monotonic() reading to reuse"""
         if not self.current_quiz:
             return {}
         
-        total_signs = len(self.current_quiz["signs"])
+        if now_ts is None:
+            now_ts = time.monotonic()
+        
         current_index = self.current_quiz["current_sign_index"]
-        time_remaining = max(0, (self.current_quiz["end_time"] - datetime.now()).total_seconds())
+        score = self.current_quiz["score"]
+        time_remaining = int(max(0, self._end_ts - now_ts))
         
-        return {
+        # Progress only changes when the sign, score or displayed second does
+        key = (current_index, score, time_remaining)
+        if self._progress_cache is not None and self._progress_cache[0] == key:
+            return dict(self._progress_cache[1])
+        
+        total_signs = self._total_signs
+        progress = {
             "current_sign_index": current_index,
             "total_signs": total_signs,
             "progress_percentage": (current_index / total_signs) * 100,
-            "score": self.current_quiz["score"],
-            "accuracy": (self.current_quiz["score"] / max(1, current_index)) * 100 if current_index > 0 else 0,
-            "time_remaining": int(time_remaining),
-            "time_remaining_formatted": self._format_time(int(time_remaining))
+            "score": score,
+            "accuracy": (score / max(1, current_index)) * 100 if current_index > 0 else 0,
+            "time_remaining": time_remaining,
+            "time_remaining_formatted": self._format_time(time_remaining)
         }
+        self._progress_cache = (key, progress)
+        # Callers and attempt results each get their own copy of the cached dict
+        return dict(progress)
     
     def _format_time(self, seconds: int) -> str:
         """Format time in MM:SS format"""
-        minutes = seconds // 60
-        seconds = seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
+        if 0 <= seconds <= 3600:
+            return _MMSS[seconds]
+        return f"{seconds // 60:02d}:{seconds % 60:02d}"
     
     def end_quiz(self) -> Dict[str, Any]:
         """End the current quiz and calculate results"""
@@ -227,8 +364,9 @@ class QuizSystem:
             return {"error": "No active quiz"}
         
         self.quiz_active = False
+        self._progress_cache = None
         self.current_quiz["completed"] = True
-        self.current_quiz["end_time"] = datetime.now()
+        self._end_ts = time.monotonic()
         
         results = self.get_quiz_results()
         self.quiz_results.append(results)
@@ -240,16 +378,16 @@ class QuizSystem:
         if not self.current_quiz:
             return {"error": "No quiz data"}
         
-        total_signs = len(self.current_quiz["signs"])
+        total_signs = self._total_signs
         correct_signs = self.current_quiz["score"]
         total_attempts = len(self.current_quiz["attempts"])
         
         accuracy = (correct_signs / total_signs) * 100 if total_signs > 0 else 0
-        passing_score = self.current_quiz["config"]["passing_score"]
+        passing_score = self._passing_score
         passed = accuracy >= passing_score
         
         # Calculate XP and level progress
-        xp_earned = self._calculate_xp(correct_signs, accuracy, self.current_quiz["config"]["difficulty"])
+        xp_earned = self._calculate_xp(correct_signs, accuracy, self._difficulty)
         
         results = {
             "quiz_type": self.current_quiz["quiz_type"],
@@ -260,9 +398,9 @@ class QuizSystem:
             "passing_score": passing_score,
             "passed": passed,
             "xp_earned": xp_earned,
-            "duration": self.current_quiz["config"]["duration"],
-            "time_taken": (self.current_quiz["end_time"] - self.current_quiz["start_time"]).total_seconds(),
-            "attempts": self.current_quiz["attempts"],
+            "duration": self._duration,
+            "time_taken": self._end_ts - self._start_ts,
+            "attempts": self.current_quiz["attempts"].to_dicts(),
             "grade": self._calculate_grade(accuracy),
             "feedback": self._get_final_feedback(accuracy, passed),
             "timestamp": datetime.now().isoformat()
@@ -279,66 +417,24 @@ class QuizSystem:
         multiplier = difficulty_multipliers.get(difficulty, 1.0)
         
         # Accuracy bonus
-        if accuracy >= 95:
-            accuracy_bonus = 50
-        elif accuracy >= 90:
-            accuracy_bonus = 30
-        elif accuracy >= 80:
-            accuracy_bonus = 20
-        else:
-            accuracy_bonus = 0
+        accuracy_bonus = _ACCURACY_BONUSES[bisect.bisect_right(_ACCURACY_BONUS_THRESHOLDS, accuracy)]
         
         total_xp = int((base_xp * multiplier) + accuracy_bonus)
         return total_xp
     
     def _calculate_grade(self, accuracy: float) -> str:
         """Calculate letter grade based on accuracy"""
-        if accuracy >= 95:
-            return "A+"
-        elif accuracy >= 90:
-            return "A"
-        elif accuracy >= 85:
-            return "B+"
-        elif accuracy >= 80:
-            return "B"
-        elif accuracy >= 75:
-            return "C+"
-        elif accuracy >= 70:
-            return "C"
-        elif accuracy >= 65:
-            return "D+"
-        elif accuracy >= 60:
-            return "D"
-        else:
-            return "F"
+        return _GRADE_LABELS[bisect.bisect_right(_GRADE_THRESHOLDS, accuracy)]
     
     def _get_final_feedback(self, accuracy: float, passed: bool) -> Dict[str, str]:
         """Get final feedback for quiz completion"""
-        if passed:
-            if accuracy >= 95:
-                return {
-                    "title": "🏆 Outstanding Performance!",
-                    "message": "You've mastered these signs with exceptional accuracy!",
-                    "color": "success"
-                }
-            elif accuracy >= 85:
-                return {
-                    "title": "🎉 Excellent Work!",
-                    "message": "Great job! You're showing strong progress in sign language.",
-                    "color": "success"
-                }
-            else:
-                return {
-                    "title": "✅ Well Done!",
-                    "message": "You passed! Keep practicing to improve your accuracy.",
-                    "color": "success"
-                }
-        else:
-            return {
-                "title": "📚 Keep Practicing!",
-                "message": "Don't worry! Practice makes perfect. Review the signs and try again.",
-                "color": "warning"
-            }
+        if not passed:
+            return _FINAL_FEEDBACK_FAILED
+        if accuracy >= 95:
+            return _FINAL_FEEDBACK_OUTSTANDING
+        if accuracy >= 85:
+            return _FINAL_FEEDBACK_EXCELLENT
+        return _FINAL_FEEDBACK_PASSED
     
     def get_quiz_status(self) -> Dict[str, Any]:
         """Get current quiz status"""
@@ -356,6 +452,7 @@ class QuizSystem:
         """Pause the current quiz"""
         if self.quiz_active and self.current_quiz:
             self.quiz_active = False
+            self._pause_ts = time.monotonic()
             return True
         return False
     
@@ -363,8 +460,10 @@ class QuizSystem:
         """Resume a paused quiz"""
         if not self.quiz_active and self.current_quiz and not self.current_quiz["completed"]:
             # Adjust end time to account for pause
-            pause_duration = datetime.now() - self.current_quiz.get("pause_start", datetime.now())
-            self.current_quiz["end_time"] += pause_duration
+            now_ts = time.monotonic()
+            if self._pause_ts is not None:
+                self._end_ts += now_ts - self._pause_ts
+                self._pause_ts = None
             self.quiz_active = True
             return True
         return False
@@ -378,22 +477,17 @@ class QuizSystem:
         if not current_sign:
             return {"error": "No current sign"}
         
-        # Record as skipped attempt
-        attempt_result = {
-            "sign": current_sign,
-            "predicted": "SKIPPED",
-            "confidence": 0.0,
-            "is_correct": False,
-            "timestamp": datetime.now().isoformat(),
-            "time_taken": (datetime.now() - self.current_quiz["start_time"]).total_seconds(),
-            "skipped": True
-        }
+        now_ts = time.monotonic()
         
-        self.current_quiz["attempts"].append(attempt_result)
-        self.current_quiz["current_sign_index"] += 1
+        # Record as skipped attempt
+        self.current_quiz["attempts"].append(
+            current_sign, "SKIPPED", 0.0, False, now_ts - self._start_ts, skipped=True
+        )
+        self._advance_sign()
+        self._progress_cache = None
         
         # Check if quiz is complete
-        if self.current_quiz["current_sign_index"] >= len(self.current_quiz["signs"]):
+        if self.current_quiz["current_sign_index"] >= self._total_signs:
             self.end_quiz()
             return {
                 "skipped": True,
@@ -404,7 +498,7 @@ class QuizSystem:
         return {
             "skipped": True,
             "next_sign": self.get_current_sign(),
-            "progress": self._get_quiz_progress()
+            "progress": self._get_quiz_progress(now_ts)
         }
     
     def get_quiz_history(self) -> List[Dict[str, Any]]:
@@ -2,15 +2,75 @@
 UserManager for handling user authentication, profiles, and data management
 """
 
+import copy
 import json
 import hashlib
-import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import hmac
+import time
+import secrets
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Set, Tuple
 import logging
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+
+def _dumps(data: Any) -> str:
+    """Pretty-print data as JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode("utf-8")
+    return json.dumps(data, indent=2, default=str)
+
+
+# Skill level -> signs needed for the next level (arbitrary thresholds; Advanced is the top)
+_NEXT_THRESHOLD = {"Beginner": 50, "Intermediate": 150, "Advanced": 300}
+
+_ONE_DAY = timedelta(days=1)
+
+# Credential fields kept on user records and never handed out or exported
+_SENSITIVE_FIELDS = frozenset({"password_hash", "password_salt", "password_kdf"})
+
+# scrypt cost for new passwords; stored per user so the cost can be raised later
+_SCRYPT_PARAMS = MappingProxyType({"n": 2 ** 14, "r": 8, "p": 1})
+
+# Read-only templates for new user records; copy them, and give each user its own list
+_DEFAULT_PROFILE: Mapping[str, Any] = MappingProxyType({
+    "skill_level": "Beginner",
+    "preferred_languages": ("ASL",),
+    "daily_goal_minutes": 15,
+    "preferred_difficulty": "Easy"
+})
+_DEFAULT_STATS: Mapping[str, Any] = MappingProxyType({
+    "total_signs_learned": 0,
+    "total_practice_time": 0,  # minutes
+    "current_streak": 0,
+    "best_streak": 0,
+    "accuracy_average": 0.0,
+    "accuracy_sum": 0.0,  # running total behind accuracy_average
+    "sessions_completed": 0
+})
+
+# Statistics mirrored into NumPy columns for the leaderboard, with their dtypes.
+# Session totals may be fractional, so they are float64 rather than truncated to ints;
+# "signs_learned" is the leaderboard's name for total_signs_learned
+_RANKED_METRICS = {
+    "total_signs_learned": np.float64,
+    "accuracy_average": np.float64,
+    "current_streak": np.int64,
+    "total_practice_time": np.float64,
+}
+_METRIC_ALIASES = {"signs_learned": "total_signs_learned"}
+
 class UserManager:
     """Manager for user authentication and profile data"""
     
@@ -19,9 +79,43 @@ class UserManager:
         self.users_data = {}
         self.current_user = None
         
+        # get_user_progress results, valid while the user's version is unchanged;
+        # every mutator bumps the version
+        self._progress_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._user_version: Dict[str, int] = defaultdict(int)
+        
+        # (user_id, day) -> check_daily_goal result; dropped when the user's goal or practice changes
+        self._daily_goal_cache: Dict[Tuple[str, date], Dict[str, Any]] = {}
+        
+        # email -> user_id, so logins don't scan every user
+        self._by_email: Dict[str, str] = {}
+        
+        # user_id -> ids of earned achievements, for constant-time duplicate checks
+        self._achievement_ids: Dict[str, Set[str]] = {}
+        
+        # Ranked statistics as one contiguous column per metric; user_id -> row via _slot_of.
+        # Rows 0.._slot_count-1 are live; deleting a user moves the last row into its place.
+        self._slot_of: Dict[str, int] = {}
+        self._slot_users: List[str] = []
+        self._metric_columns: Dict[str, np.ndarray] = {
+            metric: np.zeros(16, dtype=dtype) for metric, dtype in _RANKED_METRICS.items()
+        }
+        
+        # Formatted "now", reused for up to 100ms (see _now_iso)
+        self._iso_cache = ""
+        self._iso_ts = -1.0
+        
         # Load demo users for testing
         self._load_demo_users()
     
+    def _now_iso(self) -> str:
+        """Current time as an ISO string, reformatted at most every 100ms"""
+        t = time.monotonic()
+        if t - self._iso_ts > 0.1:
+            self._iso_cache = datetime.now().isoformat()
+            self._iso_ts = t
+        return self._iso_cache
+    
     def _load_demo_users(self):
         """Load demo users for testing purposes"""
         demo_users = {
@@ -29,20 +123,17 @@ class UserManager:
                 "user_id": "demo_user",
                 "name": "Demo User",
                 "email": "demo@example.com",
-                "created_at": datetime.now().isoformat(),
-                "last_login": datetime.now().isoformat(),
-                "profile": {
-                    "skill_level": "Beginner",
-                    "preferred_languages": ["ASL", "BSL"],
-                    "daily_goal_minutes": 15,
-                    "preferred_difficulty": "Easy"
-                },
+                "created_at": self._now_iso(),
+                "last_login": self._now_iso(),
+                "profile": {**_DEFAULT_PROFILE, "preferred_languages": ["ASL", "BSL"]},
                 "statistics": {
+                    **_DEFAULT_STATS,
                     "total_signs_learned": 12,
-                    "total_practice_time": 180,  # minutes
+                    "total_practice_time": 180,
                     "current_streak": 3,
                     "best_streak": 7,
                     "accuracy_average": 0.78,
+                    "accuracy_sum": 0.78 * 8,
                     "sessions_completed": 8
                 },
                 "achievements": [
@@ -63,6 +154,13 @@ class UserManager:
         }
         
         self.users_data = demo_users
+        self._by_email = {user_data["email"]: user_id for user_id, user_data in demo_users.items()}
+        self._achievement_ids = {
+            user_id: {a["id"] for a in user_data["achievements"]}
+            for user_id, user_data in demo_users.items()
+        }
+        for user_id in demo_users:
+            self._store_user_metrics(user_id)
     
     def authenticate_user(self, email: str, password: str) -> Optional[Dict[str, Any]]:
         """
@@ -76,20 +174,28 @@ class UserManager:
             User data if authentication successful, None otherwise
         """
         try:
-            # For demo purposes, accept any email/password combination
             if email and password:
-                # Use demo user or create new one
-                if email == "demo@example.com":
-                    user_data = self.users_data["demo_user"]
-                else:
+                user_id = self._by_email.get(email)
+                if user_id is None:
+                    # For demo purposes, unknown emails sign up on first login
                     user_data = self._create_user(email, password)
+                else:
+                    user_data = self.users_data[user_id]
+                    # Demo accounts have no stored password and accept any
+                    stored_hash = user_data.get("password_hash")
+                    if stored_hash is not None and not hmac.compare_digest(
+                        self._hash_password(password, user_data["password_salt"], user_data["password_kdf"]),
+                        stored_hash
+                    ):
+                        logger.info(f"Authentication failed: {email}")
+                        return None
                 
                 # Update last login
-                user_data["last_login"] = datetime.now().isoformat()
-                self.current_user = user_data
+                user_data["last_login"] = self._now_iso()
+                self.current_user = self._detached_record(user_data)
                 
                 logger.info(f"User authenticated: {email}")
-                return user_data
+                return self.current_user
             
             return None
             
@@ -97,41 +203,88 @@ class UserManager:
             logger.error(f"Authentication error: {str(e)}")
             return None
     
+    @staticmethod
+    def _hash_password(password: str, salt: bytes, params: Dict[str, int]) -> bytes:
+        """scrypt digest of a password with the given cost parameters"""
+        return hashlib.scrypt(
+            password.encode("utf-8"), salt=salt,
+            n=params["n"], r=params["r"], p=params["p"], dklen=32
+        )
+    
+    @staticmethod
+    def _public_record(user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """User record without credential fields, safe to hand to callers"""
+        return {k: v for k, v in user_data.items() if k not in _SENSITIVE_FIELDS}
+    
+    def _detached_record(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Deep copy of a user's public record; writes must go through the update methods,
+        which keep the progress and leaderboard caches in sync"""
+        return copy.deepcopy(self._public_record(user_data))
+    
     def _create_user(self, email: str, password: str) -> Dict[str, Any]:
         """Create a new user account"""
-        user_id = str(uuid.uuid4())
+        user_id = secrets.token_hex(16)
+        salt = secrets.token_bytes(16)
+        kdf_params = dict(_SCRYPT_PARAMS)
         
         user_data = {
             "user_id": user_id,
             "name": email.split("@")[0].title(),
             "email": email,
-            "created_at": datetime.now().isoformat(),
-            "last_login": datetime.now().isoformat(),
-            "profile": {
-                "skill_level": "Beginner",
-                "preferred_languages": ["ASL"],
-                "daily_goal_minutes": 15,
-                "preferred_difficulty": "Easy"
-            },
-            "statistics": {
-                "total_signs_learned": 0,
-                "total_practice_time": 0,
-                "current_streak": 0,
-                "best_streak": 0,
-                "accuracy_average": 0.0,
-                "sessions_completed": 0
-            },
-            "achievements": []
+            "created_at": self._now_iso(),
+            "last_login": self._now_iso(),
+            "profile": {**_DEFAULT_PROFILE, "preferred_languages": list(_DEFAULT_PROFILE["preferred_languages"])},
+            "statistics": {**_DEFAULT_STATS},
+            "achievements": [],
+            "password_salt": salt,
+            "password_kdf": kdf_params,
+            "password_hash": self._hash_password(password, salt, kdf_params)
         }
         
         self.users_data[user_id] = user_data
+        self._by_email[email] = user_id
+        self._achievement_ids[user_id] = set()
+        self._store_user_metrics(user_id)
         logger.info(f"New user created: {email}")
         
         return user_data
     
+    def _store_user_metrics(self, user_id: str) -> None:
+        """Copy a user's ranked statistics into the metric columns, assigning a row if needed"""
+        slot = self._slot_of.get(user_id)
+        if slot is None:
+            slot = len(self._slot_users)
+            capacity = len(next(iter(self._metric_columns.values())))
+            if slot == capacity:
+                # Grow by doubling; np.resize would repeat values, so copy into fresh zeros
+                for metric, column in self._metric_columns.items():
+                    grown = np.zeros(capacity * 2, dtype=column.dtype)
+                    grown[:capacity] = column
+                    self._metric_columns[metric] = grown
+            self._slot_of[user_id] = slot
+            self._slot_users.append(user_id)
+        
+        stats = self.users_data[user_id]["statistics"]
+        for metric, column in self._metric_columns.items():
+            column[slot] = stats.get(metric, 0)
+    
+    def _release_user_slot(self, user_id: str) -> None:
+        """Drop a user's row from the metric columns by moving the last row into it"""
+        slot = self._slot_of.pop(user_id, None)
+        if slot is None:
+            return
+        last = len(self._slot_users) - 1
+        last_user = self._slot_users.pop()
+        if slot != last:
+            for column in self._metric_columns.values():
+                column[slot] = column[last]
+            self._slot_users[slot] = last_user
+            self._slot_of[last_user] = slot
+    
     def get_user_data(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get user data by user ID"""
-        return self.users_data.get(user_id)
+        """Get user data by user ID, without credential fields"""
+        user_data = self.users_data.get(user_id)
+        return self._detached_record(user_data) if user_data is not None else None
     
     def update_user_profile(self, user_id: str, profile_data: Dict[str, Any]) -> bool:
         """
@@ -147,6 +300,8 @@ class UserManager:
         try:
             if user_id in self.users_data:
                 self.users_data[user_id]["profile"].update(profile_data)
+                self._user_version[user_id] += 1
+                self._daily_goal_cache.pop((user_id, datetime.now().date()), None)
                 logger.info(f"Profile updated for user: {user_id}")
                 return True
             return False
@@ -171,37 +326,33 @@ class UserManager:
                 return False
             
             stats = self.users_data[user_id]["statistics"]
+            self._user_version[user_id] += 1
             
             # Update statistics
             stats["total_signs_learned"] += session_data.get("signs_learned", 0)
             stats["total_practice_time"] += session_data.get("practice_time", 0)
             stats["sessions_completed"] += 1
             
-            # Update accuracy average
-            current_accuracy = session_data.get("accuracy", 0)
-            if stats["sessions_completed"] == 1:
-                stats["accuracy_average"] = current_accuracy
-            else:
-                # Weighted average
-                total_sessions = stats["sessions_completed"]
-                stats["accuracy_average"] = (
-                    (stats["accuracy_average"] * (total_sessions - 1) + current_accuracy) / total_sessions
-                )
+            # Update accuracy average from the running sum, so it doesn't drift over many sessions
+            stats["accuracy_sum"] += session_data.get("accuracy", 0)
+            stats["accuracy_average"] = stats["accuracy_sum"] / stats["sessions_completed"]
             
             # Update streak
-            last_session = session_data.get("date", datetime.now().date())
-            yesterday = datetime.now().date() - timedelta(days=1)
             today = datetime.now().date()
+            yesterday = today - _ONE_DAY
+            self._daily_goal_cache.pop((user_id, today), None)
+            last_session = session_data.get("date", today)
             
             if last_session == today:
                 stats["current_streak"] += 1
             elif last_session != yesterday:
-                stats["current_streak"] = 1 if last_session == today else 0
+                stats["current_streak"] = 0
             
             # Update best streak
             if stats["current_streak"] > stats["best_streak"]:
                 stats["best_streak"] = stats["current_streak"]
             
+            self._store_user_metrics(user_id)
             logger.info(f"Statistics updated for user: {user_id}")
             return True
             
@@ -225,15 +376,16 @@ class UserManager:
                 return False
             
             # Check if achievement already exists
-            existing_achievements = [a["id"] for a in self.users_data[user_id]["achievements"]]
-            
-            if achievement["id"] not in existing_achievements:
-                achievement["earned_at"] = datetime.now().isoformat()
-                self.users_data[user_id]["achievements"].append(achievement)
-                logger.info(f"Achievement '{achievement['name']}' added for user: {user_id}")
-                return True
+            achievement_ids = self._achievement_ids.setdefault(user_id, set())
+            if achievement["id"] in achievement_ids:
+                return False
             
-            return False
+            achievement["earned_at"] = self._now_iso()
+            self.users_data[user_id]["achievements"].append(achievement)
+            achievement_ids.add(achievement["id"])
+            self._user_version[user_id] += 1
+            logger.info(f"Achievement '{achievement['name']}' added for user: {user_id}")
+            return True
             
         except Exception as e:
             logger.error(f"Error adding achievement: {str(e)}")
@@ -249,40 +401,36 @@ class UserManager:
         Returns:
             Dictionary containing progress information
         """
-        try:
-            if user_id not in self.users_data:
-                return {}
-            
-            user_data = self.users_data[user_id]
-            stats = user_data["statistics"]
-            profile = user_data["profile"]
-            
-            # Calculate progress metrics
-            skill_levels = ["Beginner", "Intermediate", "Advanced"]
-            current_level_index = skill_levels.index(profile["skill_level"])
-            
-            # Signs needed for next level (arbitrary thresholds)
-            level_thresholds = [0, 50, 150, 300]
-            signs_for_next_level = level_thresholds[min(current_level_index + 1, len(level_thresholds) - 1)]
-            
-            progress_data = {
-                "current_level": profile["skill_level"],
-                "signs_learned": stats["total_signs_learned"],
-                "signs_for_next_level": signs_for_next_level,
-                "level_progress_percentage": min(100, (stats["total_signs_learned"] / signs_for_next_level) * 100) if signs_for_next_level > 0 else 100,
-                "total_practice_hours": round(stats["total_practice_time"] / 60, 1),
-                "average_accuracy": round(stats["accuracy_average"] * 100, 1),
-                "current_streak": stats["current_streak"],
-                "best_streak": stats["best_streak"],
-                "total_achievements": len(user_data["achievements"]),
-                "sessions_completed": stats["sessions_completed"]
-            }
-            
-            return progress_data
-            
-        except Exception as e:
-            logger.error(f"Error getting user progress: {str(e)}")
+        if user_id not in self.users_data:
             return {}
+        
+        version = self._user_version[user_id]
+        cached = self._progress_cache.get(user_id)
+        if cached is not None and cached[0] == version:
+            return dict(cached[1])
+        
+        user_data = self.users_data[user_id]
+        stats = user_data["statistics"]
+        profile = user_data["profile"]
+        
+        # Calculate progress metrics
+        signs_for_next_level = _NEXT_THRESHOLD.get(profile["skill_level"], 300)
+        
+        progress_data = {
+            "current_level": profile["skill_level"],
+            "signs_learned": stats["total_signs_learned"],
+            "signs_for_next_level": signs_for_next_level,
+            "level_progress_percentage": min(100, (stats["total_signs_learned"] / signs_for_next_level) * 100) if signs_for_next_level > 0 else 100,
+            "total_practice_hours": round(stats["total_practice_time"] / 60, 1),
+            "average_accuracy": round(stats["accuracy_average"] * 100, 1),
+            "current_streak": stats["current_streak"],
+            "best_streak": stats["best_streak"],
+            "total_achievements": len(user_data["achievements"]),
+            "sessions_completed": stats["sessions_completed"]
+        }
+        
+        self._progress_cache[user_id] = (version, progress_data)
+        return dict(progress_data)
     
     def export_user_data(self, user_id: str) -> Optional[str]:
         """
@@ -295,14 +443,12 @@ class UserManager:
             JSON string of user data or None if error
         """
         try:
-            if user_id in self.users_data:
-                user_data = self.users_data[user_id].copy()
-                # Remove sensitive information
-                user_data.pop("password_hash", None)
-                
-                return json.dumps(user_data, indent=2, default=str)
+            user_data = self.users_data.get(user_id)
+            if user_data is None:
+                return None
             
-            return None
+            # Leave out sensitive information without copying the nested record
+            return _dumps(self._public_record(user_data))
             
         except Exception as e:
             logger.error(f"Error exporting user data: {str(e)}")
@@ -320,7 +466,13 @@ class UserManager:
         """
         try:
             if user_id in self.users_data:
+                self._release_user_slot(user_id)
+                self._by_email.pop(self.users_data[user_id]["email"], None)
                 del self.users_data[user_id]
+                self._progress_cache.pop(user_id, None)
+                self._user_version.pop(user_id, None)
+                self._achievement_ids.pop(user_id, None)
+                self._daily_goal_cache.pop((user_id, datetime.now().date()), None)
                 logger.info(f"User account deleted: {user_id}")
                 return True
             
@@ -335,40 +487,60 @@ class UserManager:
         Get leaderboard data for specified metric
         
         Args:
-            metric: Metric to rank by (signs_learned, accuracy_average, current_streak)
+            metric: Metric to rank by (signs_learned, accuracy_average, current_streak, total_practice_time)
             limit: Number of top users to return
             
         Returns:
             List of user data sorted by metric
         """
-        try:
-            leaderboard = []
-            
-            for user_data in self.users_data.values():
-                stats = user_data["statistics"]
-                
-                entry = {
-                    "name": user_data["name"],
-                    "value": stats.get(metric, 0),
-                    "level": user_data["profile"]["skill_level"]
-                }
-                
-                # Format value based on metric
-                if metric == "accuracy_average":
-                    entry["value"] = round(entry["value"] * 100, 1)
-                elif metric == "total_practice_time":
-                    entry["value"] = round(entry["value"] / 60, 1)  # Convert to hours
-                
-                leaderboard.append(entry)
-            
-            # Sort by value (descending)
-            leaderboard.sort(key=lambda x: x["value"], reverse=True)
-            
-            return leaderboard[:limit]
-            
-        except Exception as e:
-            logger.error(f"Error getting leaderboard: {str(e)}")
+        metric = _METRIC_ALIASES.get(metric, metric)
+        if limit <= 0:
             return []
+        column = self._metric_columns.get(metric)
+        if column is not None:
+            values = column[:len(self._slot_users)]
+            if values.size == 0:
+                return []
+            if limit < values.size:
+                # Keep every row tied with the limit-th value, so ties at the cutoff are
+                # broken by the explicit ordering below rather than by argpartition
+                cutoff = np.partition(values, values.size - limit)[values.size - limit]
+                rows = np.flatnonzero(values >= cutoff)
+            else:
+                rows = np.arange(values.size)
+            user_ids = np.array([self._slot_users[row] for row in rows])
+            # Highest value first, ties by user_id
+            order = np.lexsort((user_ids, -values[rows]))[:limit]
+            top_ids = user_ids[order].tolist()
+        else:
+            # Metrics without a column are ranked on demand
+            top_ids = [
+                user_id for _, user_id in sorted(
+                    (-user_data["statistics"].get(metric, 0), user_id)
+                    for user_id, user_data in self.users_data.items()
+                )[:limit]
+            ]
+        
+        # Values come from the statistics themselves, so rankings and displayed values always agree
+        top = [(self.users_data[user_id]["statistics"].get(metric, 0), user_id) for user_id in top_ids]
+        
+        leaderboard = []
+        for value, user_id in top:
+            user_data = self.users_data[user_id]
+            
+            # Format value based on metric
+            if metric == "accuracy_average":
+                value = round(value * 100, 1)
+            elif metric == "total_practice_time":
+                value = round(value / 60, 1)  # Convert to hours
+            
+            leaderboard.append({
+                "name": user_data["name"],
+                "value": value,
+                "level": user_data["profile"]["skill_level"]
+            })
+        
+        return leaderboard
     
     def check_daily_goal(self, user_id: str) -> Dict[str, Any]:
         """
@@ -380,25 +552,32 @@ class UserManager:
         Returns:
             Dictionary with daily goal status
         """
-        try:
-            if user_id not in self.users_data:
-                return {"met_goal": False, "progress": 0}
-            
-            user_data = self.users_data[user_id]
-            daily_goal = user_data["profile"]["daily_goal_minutes"]
-            
-            # For demo purposes, assume some practice time today
-            today_practice_time = 12  # minutes (this would come from session tracking)
-            
-            progress_percentage = min(100, (today_practice_time / daily_goal) * 100)
-            
-            return {
-                "met_goal": today_practice_time >= daily_goal,
-                "progress": round(progress_percentage, 1),
-                "today_minutes": today_practice_time,
-                "goal_minutes": daily_goal
-            }
-            
-        except Exception as e:
-            logger.error(f"Error checking daily goal: {str(e)}")
+        if user_id not in self.users_data:
             return {"met_goal": False, "progress": 0}
+        
+        today = datetime.now().date()
+        key = (user_id, today)
+        cached = self._daily_goal_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
+        user_data = self.users_data[user_id]
+        daily_goal = user_data["profile"]["daily_goal_minutes"]
+        
+        # For demo purposes, assume some practice time today
+        today_practice_time = 12  # minutes (this would come from session tracking)
+        
+        progress_percentage = min(100, (today_practice_time / daily_goal) * 100)
+        
+        result = {
+            "met_goal": today_practice_time >= daily_goal,
+            "progress": round(progress_percentage, 1),
+            "today_minutes": today_practice_time,
+            "goal_minutes": daily_goal
+        }
+        
+        if len(self._daily_goal_cache) > 1000:
+            # Evict entries left over from previous days
+            self._daily_goal_cache = {k: v for k, v in self._daily_goal_cache.items() if k[1] == today}
+        self._daily_goal_cache[key] = result
+        return dict(result)
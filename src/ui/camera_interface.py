@@ -8,13 +8,64 @@ import numpy as np
 import streamlit as st
 from typing import Dict, List, Optional, Tuple, Any
 import logging
+import threading
 import time
 from PIL import Image
 import base64
 import io
 
+from src.config.settings import CAMERA_CONFIG
+
+try:
+    from streamlit_webrtc import webrtc_streamer
+    import av
+    WEBRTC_AVAILABLE = True
+except ImportError:
+    WEBRTC_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Partial reruns for the live feed (st.fragment, or st.experimental_fragment on older Streamlit)
+_FRAGMENT = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 80]
+_DISPLAY_FPS = 15
+_DISPLAY_MAX_WIDTH = 640
+
+_BBOX_PADDING = 20
+
+def _compute_bbox(pts: np.ndarray, scale_x: float, scale_y: float,
+                  width: int, height: int, padding: int) -> Tuple[int, int, int, int]:
+    """Padded, clamped pixel bounding box of (N, 2) landmark points scaled into the frame"""
+    mins = pts.min(0)
+    maxs = pts.max(0)
+    x_min = max(0, int(mins[0] * scale_x) - padding)
+    y_min = max(0, int(mins[1] * scale_y) - padding)
+    x_max = min(width, int(maxs[0] * scale_x) + padding)
+    y_max = min(height, int(maxs[1] * scale_y) + padding)
+    return x_min, y_min, x_max, y_max
+
+_RECOGNITION_INFO_HTML = (
+    '<div style="display:flex;gap:1rem">'
+    '<div style="flex:1"><small>🎯 Detected Sign</small><br><strong style="font-size:1.75rem">{0}</strong></div>'
+    '<div style="flex:1"><small>📊 Confidence</small><br><strong style="font-size:1.75rem">{1}</strong></div>'
+    '<div style="flex:1"><small>{2}</small><br><strong style="font-size:1.75rem">{3}</strong></div>'
+    '</div>'
+)
+
+# Static overlay geometry; labels are rasterized once into per-width templates
+_RECOGNITION_BOX_HEIGHT = 80
+_QUIZ_BOX_HEIGHT = 60
+_BAR_WIDTH = 200
+# Template strips also cover the rows the 2px borders bleed into outside each box
+_RECOGNITION_STRIP_HEIGHT = _RECOGNITION_BOX_HEIGHT + 1
+_QUIZ_STRIP_HEIGHT = _QUIZ_BOX_HEIGHT + 2
+_DETECTED_LABEL = "Detected: "
+_TARGET_LABEL = "Target Sign: "
+# getTextSize pads the width by half the stroke thickness; drop it to get the pen advance
+_DETECTED_LABEL_WIDTH = cv2.getTextSize(_DETECTED_LABEL, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0][0] - 1
+_TARGET_LABEL_WIDTH = cv2.getTextSize(_TARGET_LABEL, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0][0] - 1
+
 class RealTimeCameraInterface:
     """Real-time camera interface with live video feed and hand detection"""
     
@@ -23,11 +74,27 @@ class RealTimeCameraInterface:
         self.camera_manager = camera_manager
         self.quiz_system = quiz_system
         self.video_placeholder = None
+        self.info_placeholder = None
+        self._last_info_key = None
+        self._last_info_html = None
         self.controls_placeholder = None
         self.current_frame = None
+        self._last_frame_id = None
+        self._last_overlay_sig = None
+        self._last_display_frame = None
+        self._overlay_templates = {}
+        self._scratch = {}
+        self._last_display_ts = 0.0
+        self._display_interval = 1.0 / _DISPLAY_FPS
+        self._webrtc_ctx = None
+        # Guards the camera manager, quiz and overlay state the WebRTC callback uses from its worker thread
+        self._frame_lock = threading.Lock()
         
     def render_live_practice_interface(self) -> None:
         """Render the complete live practice interface"""
+        # New render pass: quiz status is fetched again on first use
+        st.session_state['_rerun_id'] = st.session_state.get('_rerun_id', 0) + 1
+        
         st.markdown("## 🎯 Live Practice Mode")
         
         # Create main layout
@@ -39,10 +106,38 @@ class RealTimeCameraInterface:
         with control_col:
             self.render_practice_controls()
     
+    def _quiz_status(self) -> Dict[str, Any]:
+        """Get quiz status, fetched at most once per render pass"""
+        state = st.session_state
+        rerun_id = state.get('_rerun_id')
+        if rerun_id is None:
+            return self._fetch_quiz_status()
+        if state.get('_qs_rerun_id') != rerun_id:
+            state['_qs'] = self._fetch_quiz_status()
+            state['_qs_rerun_id'] = rerun_id
+        return state['_qs']
+    
+    def _fetch_quiz_status(self) -> Dict[str, Any]:
+        """Query the quiz without racing the WebRTC callback"""
+        with self._frame_lock:
+            return self.quiz_system.get_quiz_status()
+    
+    def _invalidate_quiz_status(self) -> None:
+        """Drop the cached quiz status after an action that changes the quiz"""
+        st.session_state.pop('_qs_rerun_id', None)
+    
     def render_video_feed(self) -> None:
         """Render live video feed with hand detection overlay"""
         st.markdown("### 📹 Live Camera Feed")
         
+        # Browser camera over WebRTC keeps the frame loop out of Streamlit reruns (opt-in)
+        if WEBRTC_AVAILABLE and st.checkbox("🌐 Use browser camera (WebRTC)",
+                                            value=bool(CAMERA_CONFIG.get("use_webrtc", False)),
+                                            key="use_webrtc"):
+            self._render_webrtc_feed()
+            return
+        self._webrtc_ctx = None
+        
         # Video display container
         video_container = st.container()
         
@@ -54,7 +149,6 @@ class RealTimeCameraInterface:
                 if st.button("🎥 Start Camera", key="start_camera_live"):
                     if self.start_camera():
                         st.success("Camera started!")
-                        st.rerun()
                     else:
                         st.error("Failed to start camera")
             
@@ -62,20 +156,22 @@ class RealTimeCameraInterface:
                 if st.button("⏹️ Stop Camera", key="stop_camera_live"):
                     self.stop_camera()
                     st.info("Camera stopped")
-                    st.rerun()
             
             with camera_status_col3:
                 camera_active = self.camera_manager.is_camera_working()
                 status_color = "🟢" if camera_active else "🔴"
                 st.markdown(f"**Status:** {status_color} {'Active' if camera_active else 'Inactive'}")
         
-        # Video feed placeholder
-        self.video_placeholder = st.empty()
-        
         # Display live feed if camera is active
         if self.camera_manager.is_camera_working():
-            self.display_live_feed()
+            if _FRAGMENT is not None:
+                # Only the live feed re-runs at the display interval; the rest of the page stays static
+                _FRAGMENT(run_every=self._display_interval)(self._render_live_feed)()
+            else:
+                self._render_live_feed()
         else:
+            # Video feed placeholder
+            self.video_placeholder = st.empty()
             with self.video_placeholder.container():
                 st.info("📹 Start camera to see live video feed with hand detection")
                 st.markdown("**Features:**")
@@ -84,77 +180,190 @@ class RealTimeCameraInterface:
                 st.markdown("• 🎯 Live accuracy feedback")
                 st.markdown("• ⏱️ Practice timer")
     
+    def _render_webrtc_feed(self) -> None:
+        """Stream the browser camera through the recognition pipeline via WebRTC"""
+        self._webrtc_ctx = webrtc_streamer(
+            key="live",
+            video_frame_callback=self._on_frame,
+            media_stream_constraints={"video": True, "audio": False}
+        )
+        self.info_placeholder = st.empty()
+        self.display_recognition_info()
+    
+    def _on_frame(self, frame: "av.VideoFrame") -> "av.VideoFrame":
+        """WebRTC callback: track, recognize and annotate one frame on the streaming thread"""
+        image = frame.to_ndarray(format="bgr24")
+        with self._frame_lock:
+            # No script context on this thread, so query the quiz directly instead of via session state
+            quiz_status = self.quiz_system.get_quiz_status()
+            processed = self.camera_manager.process_frame(image)
+            annotated = self.add_hand_detection_overlay(processed, quiz_status)
+            return av.VideoFrame.from_ndarray(annotated, format="bgr24")
+    
+    def _feed_active(self) -> bool:
+        """Whether a live video source is currently streaming frames for sign validation"""
+        if self._webrtc_ctx is not None and self._webrtc_ctx.state.playing:
+            return True
+        return self.camera_manager.is_camera_working()
+    
+    def _set_target_sign(self, sign: str) -> None:
+        """Set the camera target sign without racing the WebRTC callback"""
+        with self._frame_lock:
+            self.camera_manager.set_target_sign(sign)
+    
+    def _render_live_feed(self) -> None:
+        """Create the live feed placeholders and draw the current frame into them"""
+        # Each fragment run is its own render pass for the quiz status cache
+        st.session_state['_rerun_id'] = st.session_state.get('_rerun_id', 0) + 1
+        
+        # Video feed placeholder
+        self.video_placeholder = st.empty()
+        self.info_placeholder = st.empty()
+        self.display_live_feed()
+    
     def display_live_feed(self) -> None:
         """Display the live camera feed with annotations"""
         try:
-            # Get processed frame from camera manager
-            frame = self.camera_manager.get_current_frame()
+            display_frame = self._get_display_frame()
             
-            if frame is not None:
-                # Add hand detection overlay
-                annotated_frame = self.add_hand_detection_overlay(frame)
+            if display_frame is not None:
+                # Update the image element in place
+                self.video_placeholder.image(display_frame, channels="BGR", use_column_width=True)
                 
-                # Convert to RGB for display
-                frame_rgb = cv2.cvtColor(annotated_frame, cv2.COLOR_BGR2RGB)
-                
-                # Display in Streamlit
-                with self.video_placeholder.container():
-                    st.image(frame_rgb, channels="RGB", use_column_width=True)
-                    
-                    # Display recognition info below video
-                    self.display_recognition_info()
+                # Display recognition info below video
+                self.display_recognition_info()
             else:
-                with self.video_placeholder.container():
-                    st.warning("No video frame available")
+                self.video_placeholder.warning("No video frame available")
                     
         except Exception as e:
             logger.error(f"Error displaying live feed: {str(e)}")
-            with self.video_placeholder.container():
-                st.error(f"Video display error: {str(e)}")
+            self.video_placeholder.error(f"Video display error: {str(e)}")
     
-    def add_hand_detection_overlay(self, frame: np.ndarray) -> np.ndarray:
-        """Add hand detection overlay with green boxes and sign labels"""
+    def _get_display_frame(self) -> Optional[Any]:
+        """Return the encoded live frame, reusing the cached one when throttled or unchanged"""
+        now = time.monotonic()
+        if self._last_display_frame is not None and now - self._last_display_ts < self._display_interval:
+            return self._last_display_frame
+        
+        # Get processed frame from camera manager
+        frame, frame_id = self.camera_manager.get_current_frame_with_id()
+        if frame is None:
+            return None
+        self._last_display_ts = now
+        
+        # Reuse the last annotated frame when nothing visible has changed
+        sig = self._overlay_signature(frame_id)
+        if sig == self._last_overlay_sig and self._last_display_frame is not None:
+            return self._last_display_frame
+        
+        # Downscale to display width first so overlay drawing and encoding touch fewer pixels
+        height, width = frame.shape[:2]
+        if width > _DISPLAY_MAX_WIDTH:
+            target = (_DISPLAY_MAX_WIDTH, int(_DISPLAY_MAX_WIDTH * height / width))
+            frame = self._downscale(frame, target)
+        
+        # Add hand detection overlay
+        annotated_frame = self.add_hand_detection_overlay(frame)
+        
+        # JPEG-encode once (imencode takes BGR directly); fall back to the raw array
+        ok, buffer = cv2.imencode('.jpg', annotated_frame, _JPEG_PARAMS)
+        # The annotated frame may live in a scratch buffer, so keep a copy if it has to be cached raw
+        display_frame = buffer.tobytes() if ok else annotated_frame.copy()
+        
+        self._last_frame_id = frame_id
+        self._last_overlay_sig = sig
+        self._last_display_frame = display_frame
+        return display_frame
+    
+    def _downscale(self, frame: np.ndarray, target: Tuple[int, int]) -> np.ndarray:
+        """Resize a frame for display into a reusable buffer"""
+        resized = self._scratch_buffer('resize', (target[1], target[0]) + frame.shape[2:], frame.dtype)
+        return cv2.resize(frame, target, dst=resized, interpolation=cv2.INTER_AREA)
+    
+    def _scratch_buffer(self, name: str, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """Return a persistent per-purpose buffer, reallocated only when the frame geometry changes"""
+        buffer = self._scratch.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._scratch[name] = buffer
+        return buffer
+    
+    def _overlay_signature(self, frame_id: int) -> Tuple:
+        """Fingerprint of everything drawn onto the live frame"""
+        recognition_results = self.camera_manager.get_recognition_results()
+        quiz_status = self._quiz_status()
+        recognition_sig = (
+            recognition_results.get('predicted_sign'),
+            recognition_results.get('confidence'),
+            recognition_results.get('is_correct')
+        ) if recognition_results else None
+        return (
+            frame_id,
+            recognition_sig,
+            quiz_status.get('active'),
+            quiz_status.get('current_sign'),
+            quiz_status.get('progress', {}).get('score'),
+            quiz_status.get('progress', {}).get('time_remaining_formatted')
+        )
+    
+    def add_hand_detection_overlay(self, frame: np.ndarray, quiz_status: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """Add hand detection overlay with green boxes and sign labels (drawn in place)"""
         try:
-            annotated_frame = frame.copy()
+            # Frames from the camera manager are already private copies, so draw on them directly;
+            # read-only frames are copied into a reusable scratch buffer instead
+            if frame.flags.writeable:
+                annotated_frame = frame
+            else:
+                annotated_frame = self._scratch_buffer('overlay', frame.shape, frame.dtype)
+                np.copyto(annotated_frame, frame)
             height, width = frame.shape[:2]
             
             # Get hand tracking results
-            if hasattr(self.camera_manager.hand_tracker, 'results') and self.camera_manager.hand_tracker.results:
-                results = self.camera_manager.hand_tracker.results
+            camera_manager = self.camera_manager
+            hand_tracker = camera_manager.hand_tracker
+            results = getattr(hand_tracker, 'results', None)
+            multi_hand_landmarks = getattr(results, 'multi_hand_landmarks', None) if results else None
+            
+            if multi_hand_landmarks:
+                # Prefer the tracker's int16 pixel landmarks, rescaled if the frame was downscaled
+                pixel_landmarks = getattr(hand_tracker, 'pixel_landmarks', None)
+                pixel_frame_size = getattr(hand_tracker, 'pixel_frame_size', None)
+                if pixel_landmarks and pixel_frame_size and len(pixel_landmarks) == len(multi_hand_landmarks):
+                    hand_points = pixel_landmarks
+                    scale_x = width / pixel_frame_size[0]
+                    scale_y = height / pixel_frame_size[1]
+                else:
+                    hand_points = [
+                        np.fromiter(
+                            (v for lm in hand_landmarks.landmark for v in (lm.x, lm.y)),
+                            dtype=np.float32, count=len(hand_landmarks.landmark) * 2
+                        ).reshape(-1, 2)
+                        for hand_landmarks in multi_hand_landmarks
+                    ]
+                    scale_x, scale_y = float(width), float(height)
                 
-                if hasattr(results, 'multi_hand_landmarks') and results.multi_hand_landmarks:
-                    for hand_landmarks in results.multi_hand_landmarks:
-                        # Calculate bounding box for hand
-                        x_coords = [landmark.x * width for landmark in hand_landmarks.landmark]
-                        y_coords = [landmark.y * height for landmark in hand_landmarks.landmark]
-                        
-                        x_min, x_max = int(min(x_coords)), int(max(x_coords))
-                        y_min, y_max = int(min(y_coords)), int(max(y_coords))
-                        
-                        # Add padding to bounding box
-                        padding = 20
-                        x_min = max(0, x_min - padding)
-                        y_min = max(0, y_min - padding)
-                        x_max = min(width, x_max + padding)
-                        y_max = min(height, y_max + padding)
-                        
-                        # Draw green bounding box
-                        cv2.rectangle(annotated_frame, (x_min, y_min), (x_max, y_max), (0, 255, 0), 3)
-                        
-                        # Add "HAND DETECTED" label
-                        cv2.putText(annotated_frame, "HAND DETECTED", (x_min, y_min - 10),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-                        
-                        # Draw hand landmarks
-                        self.camera_manager.hand_tracker.draw_landmarks(annotated_frame)
+                for pts in hand_points:
+                    # Padded bounding box clamped to the frame
+                    x_min, y_min, x_max, y_max = _compute_bbox(pts, scale_x, scale_y, width, height, _BBOX_PADDING)
+                    
+                    # Draw green bounding box
+                    cv2.rectangle(annotated_frame, (x_min, y_min), (x_max, y_max), (0, 255, 0), 3)
+                    
+                    # Add "HAND DETECTED" label
+                    cv2.putText(annotated_frame, "HAND DETECTED", (x_min, y_min - 10),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                
+                # Draw hand landmarks (draw_landmarks covers every detected hand)
+                hand_tracker.draw_landmarks(annotated_frame)
             
             # Add recognition results if available
-            recognition_results = self.camera_manager.get_recognition_results()
+            recognition_results = camera_manager.get_recognition_results()
             if recognition_results:
                 self.add_recognition_overlay(annotated_frame, recognition_results)
             
             # Add quiz info if active
-            quiz_status = self.quiz_system.get_quiz_status()
+            if quiz_status is None:
+                quiz_status = self._quiz_status()
             if quiz_status.get('active'):
                 self.add_quiz_overlay(annotated_frame, quiz_status)
             
@@ -164,6 +373,27 @@ class RealTimeCameraInterface:
             logger.error(f"Error adding overlay: {str(e)}")
             return frame
     
+    def _overlay_template(self, kind: str, width: int) -> np.ndarray:
+        """Return the pre-rendered static strip for an overlay, built once per frame width"""
+        key = (kind, width)
+        template = self._overlay_templates.get(key)
+        if template is None:
+            if kind == 'recognition':
+                strip = _RECOGNITION_STRIP_HEIGHT
+                template = np.zeros((strip, width, 3), dtype=np.uint8)
+                cv2.rectangle(template, (0, strip - _RECOGNITION_BOX_HEIGHT), (width, strip), (255, 255, 255), 2)
+                cv2.putText(template, _DETECTED_LABEL, (10, strip - 50),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+                bar_y = strip - 30
+                cv2.rectangle(template, (10, bar_y), (10 + _BAR_WIDTH, bar_y + 15), (100, 100, 100), -1)
+            else:
+                template = np.zeros((_QUIZ_STRIP_HEIGHT, width, 3), dtype=np.uint8)
+                cv2.rectangle(template, (0, 0), (width, _QUIZ_BOX_HEIGHT), (0, 255, 255), 2)
+                cv2.putText(template, _TARGET_LABEL, (10, 25),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
+            self._overlay_templates[key] = template
+        return template
+    
     def add_recognition_overlay(self, frame: np.ndarray, recognition_results: Dict[str, Any]) -> None:
         """Add sign recognition overlay to frame"""
         try:
@@ -173,34 +403,25 @@ class RealTimeCameraInterface:
             confidence = recognition_results.get('confidence', 0)
             is_correct = recognition_results.get('is_correct')
             
-            # Recognition info box background
-            overlay_height = 80
-            cv2.rectangle(frame, (0, height - overlay_height), (width, height), (0, 0, 0), -1)
-            cv2.rectangle(frame, (0, height - overlay_height), (width, height), (255, 255, 255), 2)
+            # Static box, label and bar background come from the cached template
+            frame[height - _RECOGNITION_STRIP_HEIGHT:height] = self._overlay_template('recognition', width)
             
             # Predicted sign text
-            sign_text = f"Detected: {predicted_sign}"
-            cv2.putText(frame, sign_text, (10, height - 50),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+            cv2.putText(frame, str(predicted_sign), (10 + _DETECTED_LABEL_WIDTH, height - 50),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
             
-            # Confidence bar
-            bar_width = 200
+            # Confidence fill
             bar_x = 10
             bar_y = height - 30
-            
-            # Background bar
-            cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + 15), (100, 100, 100), -1)
-            
-            # Confidence fill
-            fill_width = int(bar_width * confidence)
+            fill_width = int(_BAR_WIDTH * confidence)
             color = (0, 255, 0) if is_correct else (0, 0, 255) if confidence < 0.7 else (0, 255, 255)  # Green for correct, yellow for high confidence
             
             cv2.rectangle(frame, (bar_x, bar_y), (bar_x + fill_width, bar_y + 15), color, -1)
             
             # Confidence percentage
             conf_text = f"{confidence:.1%}"
-            cv2.putText(frame, conf_text, (bar_x + bar_width + 10, bar_y + 12),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+            cv2.putText(frame, conf_text, (bar_x + _BAR_WIDTH + 10, bar_y + 12),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
             
         except Exception as e:
             logger.error(f"Error adding recognition overlay: {str(e)}")
@@ -208,19 +429,16 @@ class RealTimeCameraInterface:
     def add_quiz_overlay(self, frame: np.ndarray, quiz_status: Dict[str, Any]) -> None:
         """Add quiz information overlay to frame"""
         try:
-            height, width = frame.shape[:2]
+            width = frame.shape[1]
             progress = quiz_status.get('progress', {})
             current_sign = quiz_status.get('current_sign', '')
             
-            # Quiz info box
-            box_height = 60
-            cv2.rectangle(frame, (0, 0), (width, box_height), (0, 0, 0), -1)
-            cv2.rectangle(frame, (0, 0), (width, box_height), (0, 255, 255), 2)
+            # Static box and label come from the cached template
+            frame[:_QUIZ_STRIP_HEIGHT] = self._overlay_template('quiz', width)
             
             # Current target sign
-            target_text = f"Target Sign: {current_sign.upper()}"
-            cv2.putText(frame, target_text, (10, 25),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
+            cv2.putText(frame, current_sign.upper(), (10 + _TARGET_LABEL_WIDTH, 25),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
             
             # Progress and timer
             score = progress.get('score', 0)
@@ -229,36 +447,35 @@ class RealTimeCameraInterface:
             
             progress_text = f"Score: {score}/{total} | Time: {time_left}"
             cv2.putText(frame, progress_text, (10, 50),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
             
         except Exception as e:
             logger.error(f"Error adding quiz overlay: {str(e)}")
     
     def display_recognition_info(self) -> None:
-        """Display recognition information below video"""
+        """Display recognition information below video as a single in-place element"""
         try:
-            recognition_results = self.camera_manager.get_recognition_results()
+            with self._frame_lock:
+                recognition_results = self.camera_manager.get_recognition_results()
+                hands_detected = self.camera_manager.hand_tracker.is_hand_visible()
             
             if recognition_results:
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    predicted_sign = recognition_results.get('predicted_sign', 'None')
-                    st.metric("🎯 Detected Sign", predicted_sign)
+                predicted_sign = recognition_results.get('predicted_sign', 'None')
+                confidence = recognition_results.get('confidence', 0)
+                is_correct = recognition_results.get('is_correct')
+                if is_correct is not None:
+                    status_label = "🎯 Status"
+                    status = "✅ Correct" if is_correct else "❌ Incorrect"
+                else:
+                    status_label = "👋 Hands"
+                    status = "✅ Detected" if hands_detected else "❌ No Hands"
                 
-                with col2:
-                    confidence = recognition_results.get('confidence', 0)
-                    st.metric("📊 Confidence", f"{confidence:.1%}")
-                
-                with col3:
-                    is_correct = recognition_results.get('is_correct')
-                    if is_correct is not None:
-                        status = "✅ Correct" if is_correct else "❌ Incorrect"
-                        st.metric("🎯 Status", status)
-                    else:
-                        hands_detected = self.camera_manager.hand_tracker.is_hand_visible()
-                        hand_status = "✅ Detected" if hands_detected else "❌ No Hands"
-                        st.metric("👋 Hands", hand_status)
+                # Rebuild the HTML only when a displayed value changed
+                info_key = (predicted_sign, f"{confidence:.1%}", status_label, status)
+                if info_key != self._last_info_key:
+                    self._last_info_key = info_key
+                    self._last_info_html = _RECOGNITION_INFO_HTML.format(*info_key)
+                self.info_placeholder.markdown(self._last_info_html, unsafe_allow_html=True)
                         
         except Exception as e:
             logger.error(f"Error displaying recognition info: {str(e)}")
@@ -276,7 +493,7 @@ class RealTimeCameraInterface:
             self.start_random_challenge()
         
         # Current activity status
-        quiz_status = self.quiz_system.get_quiz_status()
+        quiz_status = self._quiz_status()
         if quiz_status.get('active'):
             self.render_active_quiz_controls(quiz_status)
         else:
@@ -332,7 +549,7 @@ class RealTimeCameraInterface:
         st.info("Choose an option above to start practicing")
         
         # Camera status
-        if self.camera_manager.is_camera_working():
+        if self._feed_active():
             st.success("📹 Camera is active and ready")
         else:
             st.warning("📹 Please start the camera first")
@@ -365,14 +582,16 @@ class RealTimeCameraInterface:
         """Start a 3-minute practice quiz"""
         try:
             current_language = st.session_state.get('current_language', 'ASL')
-            result = self.quiz_system.start_quiz("practice", current_language)
+            with self._frame_lock:
+                result = self.quiz_system.start_quiz("practice", current_language)
+            self._invalidate_quiz_status()
             
             if result.get("success"):
                 st.success("🚀 Practice quiz started!")
                 # Set first target sign for camera
                 first_sign = result.get('first_sign')
-                if first_sign and self.camera_manager.is_camera_working():
-                    self.camera_manager.set_target_sign(first_sign)
+                if first_sign and self._feed_active():
+                    self._set_target_sign(first_sign)
                 st.rerun()
             else:
                 st.error(f"Failed to start quiz: {result.get('error', 'Unknown error')}")
@@ -400,8 +619,8 @@ class RealTimeCameraInterface:
                 }
                 
                 # Set target for camera
-                if self.camera_manager.is_camera_working():
-                    self.camera_manager.set_target_sign(challenge_sign)
+                if self._feed_active():
+                    self._set_target_sign(challenge_sign)
                 
                 st.success(f"🎯 Challenge: Sign '{challenge_sign}'!")
                 st.rerun()
@@ -415,14 +634,16 @@ class RealTimeCameraInterface:
     def skip_current_sign(self) -> None:
         """Skip the current sign in quiz"""
         try:
-            result = self.quiz_system.skip_current_sign()
+            with self._frame_lock:
+                result = self.quiz_system.skip_current_sign()
+            self._invalidate_quiz_status()
             if result.get('quiz_completed'):
                 st.balloons()
                 st.success("Quiz completed!")
             else:
                 next_sign = result.get('next_sign')
-                if next_sign and self.camera_manager.is_camera_working():
-                    self.camera_manager.set_target_sign(next_sign)
+                if next_sign and self._feed_active():
+                    self._set_target_sign(next_sign)
             st.rerun()
         except Exception as e:
             st.error(f"Error skipping sign: {str(e)}")
@@ -430,7 +651,9 @@ class RealTimeCameraInterface:
     def end_quiz(self) -> None:
         """End the current quiz"""
         try:
-            results = self.quiz_system.end_quiz()
+            with self._frame_lock:
+                results = self.quiz_system.end_quiz()
+            self._invalidate_quiz_status()
             if results:
                 st.balloons()
                 self.display_quiz_results(results)
@@ -11,6 +11,19 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+@st.cache_data
+def _build_language_options(language_items: tuple) -> tuple:
+    """Build the (option labels, language codes) pair for the language selector"""
+    options = tuple(f"{info.get('flag', '🏳️')} {info.get('name', code)}" for code, info in language_items)
+    values = tuple(code for code, _ in language_items)
+    return options, values
+
+_CONFIDENCE_BAR_HTML = (
+    '<div style="background:#eee;width:100%;height:24px;border-radius:4px">'
+    '<div style="background:{color};width:{width}%;height:100%;border-radius:4px"></div></div>'
+    '<div>Confidence: {status} ({confidence:.0f}%)</div>'
+)
+
 class UIComponents:
     """Reusable UI components for the application"""
     
@@ -22,19 +35,8 @@ class UIComponents:
         """Render language selector with flags and details"""
         
         # Create options with flags and names
-        options = []
-        values = []
-        current_index = 0
-        
-        for i, (code, info) in enumerate(languages.items()):
-            flag = info.get('flag', '🏳️')
-            name = info.get('name', code)
-            option_text = f"{flag} {name}"
-            options.append(option_text)
-            values.append(code)
-            
-            if code == current_language:
-                current_index = i
+        options, values = _build_language_options(tuple(languages.items()))
+        current_index = values.index(current_language) if current_language in values else 0
         
         # Language selector
         selected_option = st.selectbox(
@@ -53,10 +55,12 @@ class UIComponents:
         if selected_code in languages:
             lang_info = languages[selected_code]
             with st.expander("ℹ️ Language Details", expanded=False):
-                st.markdown(f"**Region:** {lang_info.get('region', 'Unknown')}")
-                st.markdown(f"**Difficulty:** {lang_info.get('difficulty', 'Unknown')}")
-                st.markdown(f"**Active Users:** {lang_info.get('users', 'Unknown')}")
-                st.markdown(f"**Description:** {lang_info.get('description', 'No description available.')}")
+                st.markdown(
+                    f"**Region:** {lang_info.get('region', 'Unknown')}\n\n"
+                    f"**Difficulty:** {lang_info.get('difficulty', 'Unknown')}\n\n"
+                    f"**Active Users:** {lang_info.get('users', 'Unknown')}\n\n"
+                    f"**Description:** {lang_info.get('description', 'No description available.')}"
+                )
         
         return selected_code
     
@@ -84,8 +88,8 @@ class UIComponents:
                 delta_color=delta_color
             )
     
-    def render_confidence_meter(self, confidence: float):
-        """Render a visual confidence meter"""
+    def render_confidence_meter(self, confidence: float, detailed: bool = False):
+        """Render a visual confidence meter (lightweight HTML bar unless detailed)"""
         
         # Determine color based on confidence
         if confidence >= 80:
@@ -98,6 +102,12 @@ class UIComponents:
             color = "red"
             status = "Needs Improvement"
         
+        if not detailed:
+            width = min(max(confidence, 0), 100)
+            st.markdown(_CONFIDENCE_BAR_HTML.format(color=color, width=width, status=status, confidence=confidence),
+                       unsafe_allow_html=True)
+            return
+        
         # Create gauge chart
         fig = go.Figure(go.Indicator(
             mode = "gauge+number+delta",
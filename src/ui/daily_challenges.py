@@ -1,18 +1,253 @@
 """
 Daily Challenges System for Sign Language Learning
 Provides interactive puzzles and challenges for daily practice
+
+Active speed challenges rerun as a fragment on Streamlit >= 1.33 (st.fragment);
+older versions fall back to full-script reruns.
 """
 
 import streamlit as st
 import random
+import string
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 import json
 
 logger = logging.getLogger(__name__)
 
+_ONE_DAY_SECONDS = 60 * 60 * 24
+
+# Partial reruns for the active challenge widget; identity decorator on older Streamlit
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+def _rerun_fragment() -> None:
+    """Rerun only the calling fragment when supported, otherwise the whole script"""
+    try:
+        st.rerun(scope="fragment")
+    except TypeError:
+        st.rerun()
+
+def _minute_bucket() -> int:
+    """Current wall-clock minute, used as the cache key for date-derived values"""
+    return int(time.time() // 60)
+
+@lru_cache(maxsize=1)
+def _date_keys(bucket: int) -> Tuple[str, str]:
+    """Today's and yesterday's date keys, formatted once per minute"""
+    now = datetime.now()
+    return now.strftime("%Y-%m-%d"), (now - timedelta(days=1)).strftime("%Y-%m-%d")
+
+def _today_key() -> str:
+    """Today's date key for session-state entries"""
+    return _date_keys(_minute_bucket())[0]
+
+@lru_cache(maxsize=1)
+def _next_reset_text(bucket: int) -> str:
+    """Time until the next midnight reset, formatted once per minute"""
+    now = datetime.now()
+    tomorrow = now + timedelta(days=1)
+    next_reset = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
+    time_diff = next_reset - now
+    
+    hours = time_diff.seconds // 3600
+    minutes = (time_diff.seconds % 3600) // 60
+    
+    return f"{hours}h {minutes}m"
+
+_CHALLENGE_TYPES = (
+    "sequence_memory",
+    "speed_signing",
+    "pattern_matching",
+    "sign_scramble",
+    "rapid_fire"
+)
+
+# Read-only templates of each daily challenge type; content is filled into a copy per generation
+_CHALLENGE_SPECS = {
+    "sequence_memory": MappingProxyType({
+        "id": "sequence_memory",
+        "title": "🧠 Sequence Memory",
+        "description": "Remember and perform a sequence of signs in the correct order",
+        "type": "sequence_memory",
+        "target": 5,
+        "xp_reward": 50,
+        "duration": "5 minutes"
+    }),
+    "speed_signing": MappingProxyType({
+        "id": "speed_signing",
+        "title": "⚡ Speed Signing",
+        "description": "Perform 10 signs as quickly and accurately as possible",
+        "type": "speed_signing", 
+        "target": 10,
+        "xp_reward": 40,
+        "duration": "3 minutes"
+    }),
+    "pattern_matching": MappingProxyType({
+        "id": "pattern_matching",
+        "title": "🔍 Pattern Matching",
+        "description": "Identify and perform signs that match given patterns",
+        "type": "pattern_matching",
+        "target": 8,
+        "xp_reward": 45,
+        "duration": "4 minutes"
+    }),
+    "sign_scramble": MappingProxyType({
+        "id": "sign_scramble",
+        "title": "🔤 Sign Scramble",
+        "description": "Unscramble the letters to form sign names, then perform them",
+        "type": "sign_scramble",
+        "target": 6,
+        "xp_reward": 35,
+        "duration": "4 minutes"
+    }),
+    "rapid_fire": MappingProxyType({
+        "id": "rapid_fire",
+        "title": "🔥 Rapid Fire",
+        "description": "Quickly respond to random sign prompts",
+        "type": "rapid_fire",
+        "target": 15,
+        "xp_reward": 60,
+        "duration": "2 minutes"
+    })
+}
+
+# Mini challenges offered alongside the daily challenge
+_MINI_CHALLENGES = (
+    MappingProxyType({
+        "id": "quick_practice",
+        "_button_key": "mini_challenge_quick_practice",
+        "title": "Quick Practice",
+        "description": "5 random signs",
+        "duration": "2 min",
+        "xp_reward": 15,
+        "signs_count": 5
+    }),
+    MappingProxyType({
+        "id": "alphabet_drill",
+        "_button_key": "mini_challenge_alphabet_drill",
+        "title": "Alphabet Drill", 
+        "description": "Sign the alphabet",
+        "duration": "3 min",
+        "xp_reward": 20,
+        "type": "alphabet"
+    }),
+    MappingProxyType({
+        "id": "number_challenge",
+        "_button_key": "mini_challenge_number_challenge",
+        "title": "Number Challenge",
+        "description": "Sign numbers 1-10",
+        "duration": "2 min", 
+        "xp_reward": 15,
+        "type": "numbers"
+    })
+)
+
+# Placeholder statistics until challenge history is persisted
+_MOCK_STATS = MappingProxyType({
+    "week": MappingProxyType({
+        "completed": 5,
+        "xp": 250,
+        "best_streak": 3
+    }),
+    "all_time": MappingProxyType({
+        "completed": 45,
+        "xp": 2250,
+        "best_streak": 7
+    })
+})
+
+# Fixed sign sets for the alphabet and number mini challenges
+_ALPHABET_SIGNS = tuple(MappingProxyType({'sign': letter}) for letter in string.ascii_uppercase)
+_NUMBER_SIGNS = tuple(MappingProxyType({'sign': str(i)}) for i in range(1, 11))
+
+_MINI_SIGN_SETS = MappingProxyType({
+    "alphabet_drill": _ALPHABET_SIGNS,
+    "number_challenge": _NUMBER_SIGNS
+})
+
+# Handler method for each daily challenge type
+_DAILY_HANDLERS = MappingProxyType({
+    "sequence_memory": "start_sequence_memory_challenge",
+    "speed_signing": "start_speed_signing_challenge",
+    "pattern_matching": "start_pattern_matching_challenge",
+    "sign_scramble": "start_sign_scramble_challenge",
+    "rapid_fire": "start_rapid_fire_challenge"
+})
+
+# Pattern predicates are referenced by tag so patterns stay picklable for st.cache_data
+_PATTERN_PREDICATES = {
+    "contains_a": lambda sign: 'a' in sign.lower(),
+    "starts_consonant": lambda sign: sign[:1].lower() not in 'aeiou',
+    "min_len_4": lambda sign: len(sign) >= 4
+}
+
+_SCRAMBLE_WORDS = ("HELLO", "THANK", "WATER", "HAPPY", "HOUSE", "APPLE")
+
+_OVERVIEW_METRICS_HTML = (
+    '<div style="display:flex;gap:1rem;flex-wrap:wrap;">'
+    '<div style="flex:1;"><div style="font-size:0.875rem;opacity:0.7;">✅ Completed Today</div>'
+    '<div style="font-size:1.75rem;">{completed}</div></div>'
+    '<div style="flex:1;"><div style="font-size:0.875rem;opacity:0.7;">🎁 XP Today</div>'
+    '<div style="font-size:1.75rem;">+{xp}</div></div>'
+    '<div style="flex:1;"><div style="font-size:0.875rem;opacity:0.7;">⏰ Reset In</div>'
+    '<div style="font-size:1.75rem;">{reset}</div></div>'
+    '</div>'
+)
+
+@lru_cache(maxsize=1)
+def _build_sign_patterns() -> Tuple[MappingProxyType, ...]:
+    """Build the static, read-only sign patterns for pattern matching"""
+    return (
+        MappingProxyType({
+            "description": "contain the letter 'A'",
+            "examples": ("Apple", "Water", "Amazing"),
+            "criteria_key": "contains_a"
+        }),
+        MappingProxyType({
+            "description": "start with a consonant",
+            "examples": ("Book", "Cat", "Dog"),
+            "criteria_key": "starts_consonant"
+        }),
+        MappingProxyType({
+            "description": "have 4 or more letters",
+            "examples": ("House", "Computer", "Happy"),
+            "criteria_key": "min_len_4"
+        })
+    )
+
+@st.cache_data(ttl=_ONE_DAY_SECONDS, show_spinner=False)
+def _build_scrambled_signs(date_str: str) -> List[Dict[str, str]]:
+    """Build the day's scrambled signs for the word puzzle"""
+    # Seeded by date so the puzzle is stable for the day even if the cache is cleared
+    rng = random.Random(date_str)
+    return [
+        {"original": word, "scrambled": "".join(rng.sample(word, len(word)))}
+        for word in _SCRAMBLE_WORDS
+    ]
+
+@st.cache_data(ttl=_ONE_DAY_SECONDS, show_spinner=False)
+def _generate_daily_challenge_cached(date_str: str, language: str, challenge_type: str,
+                                     _quiz_database) -> Dict[str, Any]:
+    """Generate the daily challenge once per (date, language, type); the database is not hashed"""
+    challenge: Dict[str, Any] = dict(_CHALLENGE_SPECS[challenge_type])
+    
+    # Only the selected challenge's content is built, from a single pool lookup
+    if challenge_type == "pattern_matching":
+        challenge["patterns"] = [dict(pattern) for pattern in _build_sign_patterns()]
+    elif challenge_type == "sign_scramble":
+        challenge["scrambled_signs"] = _build_scrambled_signs(date_str)
+    else:
+        # Same date seed as the type choice, so a cache miss rebuilds the same signs;
+        # the pool's read-only records are copied to dicts so st.cache_data can pickle them
+        pool = _quiz_database.get_practice_pool()
+        challenge["signs"] = [dict(q) for q in random.Random(date_str).sample(pool, challenge["target"])]
+    
+    return challenge
+
 class DailyChallengesSystem:
     """Manages daily challenges and puzzles for sign language learning"""
     
@@ -20,13 +255,7 @@ class DailyChallengesSystem:
         """Initialize daily challenges system"""
         self.quiz_database = quiz_database
         self.progress_manager = progress_manager
-        self.challenge_types = [
-            "sequence_memory",
-            "speed_signing", 
-            "pattern_matching",
-            "sign_scramble",
-            "rapid_fire"
-        ]
+        self.challenge_types = _CHALLENGE_TYPES
         
     def render_daily_challenges_interface(self) -> None:
         """Render the main daily challenges interface"""
@@ -48,23 +277,21 @@ class DailyChallengesSystem:
         """Render challenge overview section"""
         st.markdown("### 🌟 Today's Challenge Overview")
         
-        col1, col2, col3, col4 = st.columns(4)
+        col1, col2 = st.columns([1, 3])
         
         with col1:
             streak = self.get_daily_streak()
             st.metric("🔥 Daily Streak", f"{streak} days")
         
         with col2:
-            completed_today = self.get_challenges_completed_today()
-            st.metric("✅ Completed Today", completed_today)
-        
-        with col3:
-            total_xp_today = self.get_xp_earned_today()
-            st.metric("🎁 XP Today", f"+{total_xp_today}")
-        
-        with col4:
-            next_reset = self.get_next_reset_time()
-            st.metric("⏰ Reset In", next_reset)
+            st.markdown(
+                _OVERVIEW_METRICS_HTML.format(
+                    completed=self.get_challenges_completed_today(),
+                    xp=self.get_xp_earned_today(),
+                    reset=self.get_next_reset_time()
+                ),
+                unsafe_allow_html=True
+            )
     
     def render_daily_challenge(self) -> None:
         """Render the main daily challenge"""
@@ -75,8 +302,7 @@ class DailyChallengesSystem:
         if daily_challenge:
             # Challenge card
             with st.container():
-                st.markdown(f"#### {daily_challenge['title']}")
-                st.markdown(daily_challenge['description'])
+                st.markdown(f"#### {daily_challenge['title']}\n\n{daily_challenge['description']}")
                 
                 # Challenge progress
                 progress = self.get_challenge_progress(daily_challenge['id'])
@@ -107,19 +333,22 @@ class DailyChallengesSystem:
             for idx, challenge in enumerate(mini_challenges[:3]):
                 with cols[idx % 3]:
                     with st.container():
-                        st.markdown(f"**{challenge['title']}**")
-                        st.markdown(challenge['description'])
-                        st.markdown(f"⏱️ {challenge['duration']}")
-                        st.markdown(f"🎁 +{challenge['xp_reward']} XP")
+                        st.markdown(
+                            f"**{challenge['title']}**\n\n"
+                            f"{challenge['description']}\n\n"
+                            f"⏱️ {challenge['duration']}\n\n"
+                            f"🎁 +{challenge['xp_reward']} XP"
+                        )
                         
-                        if st.button(f"Start", key=f"mini_challenge_{challenge['id']}"):
+                        if st.button("Start", key=challenge['_button_key']):
                             self.start_mini_challenge(challenge)
         else:
             st.info("No mini challenges available right now. Check back later!")
     
     def render_challenge_statistics(self) -> None:
-        """Render challenge statistics and history"""
-        with st.expander("📊 Challenge Statistics"):
+        """Render challenge statistics and history on demand"""
+        # Statistics are only fetched and rendered while the toggle is on
+        if st.toggle("📊 Show Challenge Statistics", key="_show_stats"):
             stats = self.get_challenge_statistics()
             
             col1, col2 = st.columns(2)
@@ -138,7 +367,7 @@ class DailyChallengesSystem:
     
     def get_daily_challenge(self) -> Optional[Dict[str, Any]]:
         """Get today's daily challenge"""
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = _today_key()
         
         # Check if we have a cached challenge for today
         if 'daily_challenge' not in st.session_state or st.session_state.get('challenge_date') != today:
@@ -150,123 +379,43 @@ class DailyChallengesSystem:
     
     def generate_daily_challenge(self) -> Dict[str, Any]:
         """Generate a new daily challenge"""
-        challenge_type = random.choice(self.challenge_types)
+        today = _today_key()
+        # Seeded by date so every session shares the same (cached) challenge for the day
+        challenge_type = random.Random(today).choice(self.challenge_types)
         current_language = st.session_state.get('current_language', 'ASL')
         
-        challenges = {
-            "sequence_memory": {
-                "id": "sequence_memory",
-                "title": "🧠 Sequence Memory",
-                "description": "Remember and perform a sequence of signs in the correct order",
-                "type": "sequence_memory",
-                "target": 5,
-                "xp_reward": 50,
-                "duration": "5 minutes",
-                "signs": random.sample(self.quiz_database.get_practice_questions(10), 5)
-            },
-            "speed_signing": {
-                "id": "speed_signing",
-                "title": "⚡ Speed Signing",
-                "description": "Perform 10 signs as quickly and accurately as possible",
-                "type": "speed_signing", 
-                "target": 10,
-                "xp_reward": 40,
-                "duration": "3 minutes",
-                "signs": random.sample(self.quiz_database.get_practice_questions(15), 10)
-            },
-            "pattern_matching": {
-                "id": "pattern_matching",
-                "title": "🔍 Pattern Matching",
-                "description": "Identify and perform signs that match given patterns",
-                "type": "pattern_matching",
-                "target": 8,
-                "xp_reward": 45,
-                "duration": "4 minutes",
-                "patterns": self.generate_sign_patterns()
-            },
-            "sign_scramble": {
-                "id": "sign_scramble",
-                "title": "🔤 Sign Scramble",
-                "description": "Unscramble the letters to form sign names, then perform them",
-                "type": "sign_scramble",
-                "target": 6,
-                "xp_reward": 35,
-                "duration": "4 minutes",
-                "scrambled_signs": self.generate_scrambled_signs()
-            },
-            "rapid_fire": {
-                "id": "rapid_fire",
-                "title": "🔥 Rapid Fire",
-                "description": "Quickly respond to random sign prompts",
-                "type": "rapid_fire",
-                "target": 15,
-                "xp_reward": 60,
-                "duration": "2 minutes",
-                "signs": random.sample(self.quiz_database.get_practice_questions(20), 15)
-            }
-        }
-        
-        return challenges[challenge_type]
+        return _generate_daily_challenge_cached(today, current_language, challenge_type, self.quiz_database)
     
-    def get_available_mini_challenges(self) -> List[Dict[str, Any]]:
+    def get_available_mini_challenges(self) -> List[Mapping[str, Any]]:
         """Get available mini challenges"""
-        mini_challenges = [
-            {
-                "id": "quick_practice",
-                "title": "Quick Practice",
-                "description": "5 random signs",
-                "duration": "2 min",
-                "xp_reward": 15,
-                "signs_count": 5
-            },
-            {
-                "id": "alphabet_drill",
-                "title": "Alphabet Drill", 
-                "description": "Sign the alphabet",
-                "duration": "3 min",
-                "xp_reward": 20,
-                "type": "alphabet"
-            },
-            {
-                "id": "number_challenge",
-                "title": "Number Challenge",
-                "description": "Sign numbers 1-10",
-                "duration": "2 min", 
-                "xp_reward": 15,
-                "type": "numbers"
-            }
-        ]
+        today = _today_key()
         
         # Filter out completed challenges
-        available = []
-        for challenge in mini_challenges:
-            if not self.is_mini_challenge_completed_today(challenge['id']):
-                available.append(challenge)
-        
-        return available
+        completed = {
+            challenge['id'] for challenge in _MINI_CHALLENGES
+            if st.session_state.get(f"mini_challenge_{challenge['id']}_{today}", False)
+        }
+        return [challenge for challenge in _MINI_CHALLENGES if challenge['id'] not in completed]
+    
+    def _build_active_challenge(self, challenge: Mapping[str, Any], kind: str) -> Dict[str, Any]:
+        """Build the session state scaffolding for a newly started challenge"""
+        return {
+            "challenge": challenge,
+            "start_time": time.time(),
+            "current_step": 0,
+            "score": 0,
+            "completed_signs": [],
+            "type": kind
+        }
     
     def start_challenge(self, challenge: Dict[str, Any]) -> None:
         """Start a daily challenge"""
         try:
-            st.session_state.active_challenge = {
-                "challenge": challenge,
-                "start_time": time.time(),
-                "current_step": 0,
-                "score": 0,
-                "completed_signs": [],
-                "type": "daily"
-            }
+            st.session_state.active_challenge = self._build_active_challenge(challenge, "daily")
             
-            if challenge['type'] == 'sequence_memory':
-                self.start_sequence_memory_challenge(challenge)
-            elif challenge['type'] == 'speed_signing':
-                self.start_speed_signing_challenge(challenge)
-            elif challenge['type'] == 'pattern_matching':
-                self.start_pattern_matching_challenge(challenge)
-            elif challenge['type'] == 'sign_scramble':
-                self.start_sign_scramble_challenge(challenge)
-            elif challenge['type'] == 'rapid_fire':
-                self.start_rapid_fire_challenge(challenge)
+            handler = _DAILY_HANDLERS.get(challenge['type'])
+            if handler:
+                getattr(self, handler)(challenge)
             
             st.rerun()
             
@@ -274,28 +423,17 @@ class DailyChallengesSystem:
             st.error(f"Error starting challenge: {str(e)}")
             logger.error(f"Challenge start error: {str(e)}")
     
-    def start_mini_challenge(self, challenge: Dict[str, Any]) -> None:
+    def start_mini_challenge(self, challenge: Mapping[str, Any]) -> None:
         """Start a mini challenge"""
         try:
-            st.session_state.active_challenge = {
-                "challenge": challenge,
-                "start_time": time.time(),
-                "current_step": 0,
-                "score": 0,
-                "completed_signs": [],
-                "type": "mini"
-            }
+            active_challenge = self._build_active_challenge(challenge, "mini")
             
             if challenge['id'] == 'quick_practice':
-                signs = random.sample(self.quiz_database.get_practice_questions(10), 5)
-                st.session_state.active_challenge['signs'] = signs
-            elif challenge['id'] == 'alphabet_drill':
-                alphabet_signs = [{'sign': chr(i)} for i in range(ord('A'), ord('Z')+1)]
-                st.session_state.active_challenge['signs'] = alphabet_signs
-            elif challenge['id'] == 'number_challenge':
-                number_signs = [{'sign': str(i)} for i in range(1, 11)]
-                st.session_state.active_challenge['signs'] = number_signs
+                active_challenge['signs'] = random.sample(self.quiz_database.get_practice_questions(10), 5)
+            elif challenge['id'] in _MINI_SIGN_SETS:
+                active_challenge['signs'] = _MINI_SIGN_SETS[challenge['id']]
             
+            st.session_state.active_challenge = active_challenge
             st.success(f"🚀 {challenge['title']} started!")
             st.rerun()
             
@@ -334,7 +472,7 @@ class DailyChallengesSystem:
             st.markdown("### Ready to start?")
             if st.button("🚀 Start Speed Challenge!", type="primary"):
                 st.session_state.challenge_phase = "active"
-                st.session_state.speed_challenge_start = time.time()
+                st.session_state.speed_challenge_start = time.monotonic()
                 st.session_state.current_sign_index = 0
                 st.rerun()
         
@@ -389,41 +527,46 @@ class DailyChallengesSystem:
             st.session_state.current_prompt_index = 0
             st.rerun()
     
+    @_fragment
     def render_active_speed_challenge(self, challenge: Dict[str, Any]) -> None:
         """Render active speed signing challenge"""
         current_index = st.session_state.get('current_sign_index', 0)
         signs = challenge['signs']
+        total_signs = len(signs)
         
-        if current_index < len(signs):
+        if current_index < total_signs:
             current_sign = signs[current_index]['sign']
             
             # Time remaining
-            elapsed = time.time() - st.session_state.speed_challenge_start
+            elapsed = time.monotonic() - st.session_state.speed_challenge_start
             time_limit = 180  # 3 minutes
             remaining = max(0, time_limit - elapsed)
             
             st.markdown(f"### Current Sign: **{current_sign.upper()}**")
             st.markdown(f"⏱️ Time Remaining: {int(remaining)}s")
-            st.markdown(f"Progress: {current_index + 1}/{len(signs)}")
+            st.markdown(f"Progress: {current_index + 1}/{total_signs}")
             
             # Progress bar
-            progress = (current_index + 1) / len(signs)
-            st.progress(progress)
+            st.progress((current_index + 1) / total_signs)
             
             if remaining <= 0:
                 self.complete_speed_challenge(challenge, current_index)
             else:
                 if st.button("✅ Signed it!", key=f"speed_sign_{current_index}"):
-                    st.session_state.current_sign_index += 1
-                    if st.session_state.current_sign_index >= len(signs):
-                        self.complete_speed_challenge(challenge, len(signs))
-                    st.rerun()
+                    next_index = current_index + 1
+                    st.session_state.current_sign_index = next_index
+                    if next_index >= total_signs:
+                        # Completion changes the overview and XP totals, so refresh the whole page
+                        self.complete_speed_challenge(challenge, total_signs)
+                        st.rerun()
+                    else:
+                        _rerun_fragment()
         else:
-            self.complete_speed_challenge(challenge, len(signs))
+            self.complete_speed_challenge(challenge, total_signs)
     
     def complete_speed_challenge(self, challenge: Dict[str, Any], completed_signs: int) -> None:
         """Complete speed signing challenge"""
-        elapsed = time.time() - st.session_state.speed_challenge_start
+        elapsed = time.monotonic() - st.session_state.speed_challenge_start
         
         st.balloons()
         st.success("🎉 Speed Challenge Completed!")
@@ -457,41 +600,17 @@ class DailyChallengesSystem:
         if 'challenge_phase' in st.session_state:
             del st.session_state.challenge_phase
     
-    def generate_sign_patterns(self) -> List[Dict[str, Any]]:
+    def generate_sign_patterns(self) -> Tuple[MappingProxyType, ...]:
         """Generate sign patterns for pattern matching"""
-        patterns = [
-            {
-                "description": "contain the letter 'A'",
-                "examples": ["Apple", "Water", "Amazing"],
-                "criteria": lambda sign: 'a' in sign.lower()
-            },
-            {
-                "description": "start with a consonant",
-                "examples": ["Book", "Cat", "Dog"],
-                "criteria": lambda sign: sign[0].lower() not in 'aeiou'
-            },
-            {
-                "description": "have 4 or more letters",
-                "examples": ["House", "Computer", "Happy"],
-                "criteria": lambda sign: len(sign) >= 4
-            }
-        ]
-        return patterns
+        return _build_sign_patterns()
+    
+    def matches_pattern(self, pattern: Dict[str, Any], sign: str) -> bool:
+        """Check whether a sign satisfies a pattern's criteria tag"""
+        return _PATTERN_PREDICATES[pattern['criteria_key']](sign)
     
     def generate_scrambled_signs(self) -> List[Dict[str, str]]:
         """Generate scrambled signs for word puzzle"""
-        signs = ["HELLO", "THANK", "WATER", "HAPPY", "HOUSE", "APPLE"]
-        scrambled = []
-        
-        for sign in signs:
-            scrambled_letters = list(sign)
-            random.shuffle(scrambled_letters)
-            scrambled.append({
-                "original": sign,
-                "scrambled": "".join(scrambled_letters)
-            })
-        
-        return scrambled
+        return _build_scrambled_signs(_today_key())
     
     def get_daily_streak(self) -> int:
         """Get current daily streak"""
@@ -500,84 +619,65 @@ class DailyChallengesSystem:
     
     def get_challenges_completed_today(self) -> int:
         """Get number of challenges completed today"""
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = _today_key()
         completed_today = st.session_state.get(f'challenges_completed_{today}', 0)
         return completed_today
     
     def get_xp_earned_today(self) -> int:
         """Get XP earned today from challenges"""
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = _today_key()
         xp_today = st.session_state.get(f'challenge_xp_{today}', 0)
         return xp_today
     
     def get_next_reset_time(self) -> str:
         """Get time until next daily reset"""
-        now = datetime.now()
-        tomorrow = now + timedelta(days=1)
-        next_reset = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
-        time_diff = next_reset - now
-        
-        hours = time_diff.seconds // 3600
-        minutes = (time_diff.seconds % 3600) // 60
-        
-        return f"{hours}h {minutes}m"
+        return _next_reset_text(_minute_bucket())
     
     def get_challenge_progress(self, challenge_id: str) -> Dict[str, Any]:
         """Get progress for a specific challenge"""
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = _today_key()
         progress_key = f"challenge_progress_{challenge_id}_{today}"
         
         default_progress = {"current": 0, "target": 1, "completed": False}
         return st.session_state.get(progress_key, default_progress)
     
-    def get_challenge_statistics(self) -> Dict[str, Any]:
+    def get_challenge_statistics(self) -> Mapping[str, Any]:
         """Get challenge statistics"""
-        # Mock statistics - implement with real data storage
-        return {
-            "week": {
-                "completed": 5,
-                "xp": 250,
-                "best_streak": 3
-            },
-            "all_time": {
-                "completed": 45,
-                "xp": 2250,
-                "best_streak": 7
-            }
-        }
+        # Mock statistics - implement with real data storage (cache per user with st.cache_data then)
+        return _MOCK_STATS
     
     def is_mini_challenge_completed_today(self, challenge_id: str) -> bool:
         """Check if mini challenge is completed today"""
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = _today_key()
         completed_key = f"mini_challenge_{challenge_id}_{today}"
         return st.session_state.get(completed_key, False)
     
     def mark_challenge_completed(self, challenge_id: str, results: Dict[str, Any]) -> None:
         """Mark a challenge as completed"""
-        today = datetime.now().strftime("%Y-%m-%d")
+        today, yesterday = _date_keys(_minute_bucket())
+        state = st.session_state
         
-        # Mark challenge as completed
-        progress_key = f"challenge_progress_{challenge_id}_{today}"
-        st.session_state[progress_key] = {
-            "current": results.get('completed_signs', 1),
-            "target": 1,
-            "completed": True
-        }
-        
-        # Update daily totals
         challenges_key = f'challenges_completed_{today}'
-        st.session_state[challenges_key] = st.session_state.get(challenges_key, 0) + 1
-        
         xp_key = f'challenge_xp_{today}'
-        st.session_state[xp_key] = st.session_state.get(xp_key, 0) + results.get('xp_earned', 0)
         
-        # Update streak
-        self.update_daily_streak()
+        # Streak continues only if a challenge was completed yesterday
+        yesterday_completed = state.get(f'challenges_completed_{yesterday}', 0) > 0
+        
+        # Progress, daily totals and streak are written in a single update
+        state.update({
+            f"challenge_progress_{challenge_id}_{today}": {
+                "current": results.get('completed_signs', 1),
+                "target": 1,
+                "completed": True
+            },
+            challenges_key: state.get(challenges_key, 0) + 1,
+            xp_key: state.get(xp_key, 0) + results.get('xp_earned', 0),
+            'daily_streak': state.get('daily_streak', 0) + 1 if yesterday_completed else 1
+        })
     
     def update_daily_streak(self) -> None:
         """Update the daily streak counter"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        today, yesterday = _date_keys(_minute_bucket())
         
         # Check if completed yesterday
         yesterday_completed = st.session_state.get(f'challenges_completed_{yesterday}', 0) > 0
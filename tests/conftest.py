@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+from src.core.hand_tracker import HandTracker
+
+@pytest.fixture(scope="session")
+def hand_tracker():
+    """Shared HandTracker, so the MediaPipe graph is built once per test run"""
+    tracker = HandTracker()
+    yield tracker
+    tracker.close()
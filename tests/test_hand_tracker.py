@@ -5,165 +5,195 @@ Unit tests for the HandTracker module
 import pytest
 import numpy as np
 import cv2
-from unittest.mock import Mock, patch
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest.mock import patch
 from src.core.hand_tracker import HandTracker
 
+@dataclass
+class _Landmark:
+    """Stand-in for a MediaPipe normalized landmark"""
+    x: float = 0.5
+    y: float = 0.5
+    z: float = 0.0
+
+@dataclass
+class _Hand:
+    """Stand-in for one hand's landmark list"""
+    landmark: List[_Landmark] = field(default_factory=list)
+
+@dataclass
+class _Classification:
+    """Stand-in for a handedness classification"""
+    label: str
+    score: float
+
+@dataclass
+class _Handedness:
+    """Stand-in for one hand's handedness result"""
+    classification: List[_Classification]
+
+@dataclass
+class _Results:
+    """Stand-in for MediaPipe Hands.process() results"""
+    multi_hand_landmarks: Optional[List[_Hand]]
+    multi_handedness: Optional[List[_Handedness]] = None
+
+# hands.process is mocked, so frame content is irrelevant
+_SAMPLE_FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+
+@pytest.fixture(scope="module")
+def mock_hand_results():
+    """Detection results for one right hand; only read by the tests"""
+    return _Results(
+        multi_hand_landmarks=[_Hand(landmark=[_Landmark()] * 21)],  # 21 landmarks per hand
+        multi_handedness=[_Handedness(classification=[_Classification(label="Right", score=0.9)])]
+    )
+
+@pytest.fixture(autouse=True)
+def _reset_results(hand_tracker):
+    """Clear detection results left behind by the previous test"""
+    hand_tracker.results = None
+
 class TestHandTracker:
     """Test cases for HandTracker class"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.tracker = HandTracker()
-        self.sample_frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
-    
-    def test_initialization(self):
+    def test_initialization(self, hand_tracker):
         """Test HandTracker initialization"""
-        assert self.tracker.mp_hands is not None
-        assert self.tracker.mp_drawing is not None
-        assert self.tracker.hands is not None
-        assert self.tracker.results is None
+        assert hand_tracker.mp_hands is not None
+        assert hand_tracker.mp_drawing is not None
+        assert hand_tracker.hands is not None
+        assert hand_tracker.results is None
     
-    def test_process_frame_no_hands(self):
+    def test_process_frame_no_hands(self, hand_tracker):
         """Test frame processing with no hands detected"""
-        with patch.object(self.tracker.hands, 'process') as mock_process:
-            mock_process.return_value = Mock(multi_hand_landmarks=None)
+        with patch.object(hand_tracker.hands, 'process') as mock_process:
+            mock_process.return_value = _Results(multi_hand_landmarks=None)
             
-            processed_frame, hands_detected = self.tracker.process_frame(self.sample_frame)
+            processed_frame, hands_detected = hand_tracker.process_frame(_SAMPLE_FRAME)
             
             assert processed_frame is not None
             assert hands_detected is False
     
-    def test_process_frame_with_hands(self):
+    def test_process_frame_with_hands(self, hand_tracker):
         """Test frame processing with hands detected"""
-        with patch.object(self.tracker.hands, 'process') as mock_process:
-            mock_landmarks = Mock()
-            mock_process.return_value = Mock(multi_hand_landmarks=[mock_landmarks])
+        with patch.object(hand_tracker.hands, 'process') as mock_process:
+            mock_process.return_value = _Results(multi_hand_landmarks=[_Hand(landmark=[_Landmark()] * 21)])
             
-            processed_frame, hands_detected = self.tracker.process_frame(self.sample_frame)
+            processed_frame, hands_detected = hand_tracker.process_frame(_SAMPLE_FRAME)
             
             assert processed_frame is not None
             assert hands_detected is True
     
-    def test_get_landmarks_no_hands(self):
+    def test_get_landmarks_no_hands(self, hand_tracker):
         """Test landmark extraction with no hands"""
-        self.tracker.results = Mock(multi_hand_landmarks=None)
-        landmarks = self.tracker.get_landmarks()
+        hand_tracker.results = _Results(multi_hand_landmarks=None)
+        landmarks = hand_tracker.get_landmarks()
         
         assert landmarks == []
     
-    def test_get_landmarks_with_hands(self):
+    def test_get_landmarks_with_hands(self, hand_tracker, mock_hand_results):
         """Test landmark extraction with hands detected"""
-        # Mock hand landmarks
-        mock_landmark = Mock()
-        mock_landmark.x = 0.5
-        mock_landmark.y = 0.5
-        mock_landmark.z = 0.0
-        
-        mock_hand_landmarks = Mock()
-        mock_hand_landmarks.landmark = [mock_landmark] * 21  # 21 landmarks per hand
-        
-        mock_classification = Mock()
-        mock_classification.label = "Right"
-        mock_classification.score = 0.9
+        hand_tracker.results = mock_hand_results
         
-        mock_handedness = Mock()
-        mock_handedness.classification = [mock_classification]
-        
-        self.tracker.results = Mock(
-            multi_hand_landmarks=[mock_hand_landmarks],
-            multi_handedness=[mock_handedness]
-        )
-        
-        landmarks = self.tracker.get_landmarks()
+        landmarks = hand_tracker.get_landmarks()
         
         assert len(landmarks) == 1
         assert landmarks[0]['hand_label'] == "Right"
         assert landmarks[0]['confidence'] == 0.9
         assert len(landmarks[0]['landmarks']) == 21
     
-    def test_get_hand_features_no_hands(self):
+    def test_get_hand_features_no_hands(self, hand_tracker):
         """Test feature extraction with no hands"""
-        self.tracker.results = Mock(multi_hand_landmarks=None)
-        features = self.tracker.get_hand_features()
+        hand_tracker.results = _Results(multi_hand_landmarks=None)
+        features = hand_tracker.get_hand_features()
         
         assert features is None
     
-    def test_get_hand_features_with_hands(self):
+    def test_get_hand_features_with_hands(self, hand_tracker, mock_hand_results):
         """Test feature extraction with hands detected"""
-        # Mock hand landmarks
-        mock_landmark = Mock()
-        mock_landmark.x = 0.5
-        mock_landmark.y = 0.5
-        mock_landmark.z = 0.0
-        
-        mock_hand_landmarks = Mock()
-        mock_hand_landmarks.landmark = [mock_landmark] * 21
-        
-        mock_classification = Mock()
-        mock_classification.label = "Right"
-        mock_classification.score = 0.9
-        
-        mock_handedness = Mock()
-        mock_handedness.classification = [mock_classification]
+        hand_tracker.results = mock_hand_results
         
-        self.tracker.results = Mock(
-            multi_hand_landmarks=[mock_hand_landmarks],
-            multi_handedness=[mock_handedness]
-        )
-        
-        features = self.tracker.get_hand_features()
+        features = hand_tracker.get_hand_features()
         
         assert features is not None
         assert isinstance(features, np.ndarray)
         assert len(features) > 0
     
-    def test_is_hand_visible(self):
+    def test_is_hand_visible(self, hand_tracker):
         """Test hand visibility check"""
         # No hands
-        self.tracker.results = None
-        assert self.tracker.is_hand_visible() is False
+        hand_tracker.results = None
+        assert hand_tracker.is_hand_visible() is False
         
         # With hands
-        self.tracker.results = Mock(multi_hand_landmarks=[Mock()])
-        assert self.tracker.is_hand_visible() is True
+        hand_tracker.results = _Results(multi_hand_landmarks=[_Hand()])
+        assert hand_tracker.is_hand_visible() is True
     
-    def test_get_hand_count(self):
+    def test_get_hand_count(self, hand_tracker):
         """Test hand count functionality"""
         # No hands
-        self.tracker.results = None
-        assert self.tracker.get_hand_count() == 0
+        hand_tracker.results = None
+        assert hand_tracker.get_hand_count() == 0
         
         # One hand
-        self.tracker.results = Mock(multi_hand_landmarks=[Mock()])
-        assert self.tracker.get_hand_count() == 1
+        hand_tracker.results = _Results(multi_hand_landmarks=[_Hand()])
+        assert hand_tracker.get_hand_count() == 1
         
         # Two hands
-        self.tracker.results = Mock(multi_hand_landmarks=[Mock(), Mock()])
-        assert self.tracker.get_hand_count() == 2
+        hand_tracker.results = _Results(multi_hand_landmarks=[_Hand(), _Hand()])
+        assert hand_tracker.get_hand_count() == 2
     
-    def test_euclidean_distance(self):
+    def test_euclidean_distance(self, hand_tracker):
         """Test Euclidean distance calculation"""
         p1 = {'x': 0.0, 'y': 0.0, 'z': 0.0}
         p2 = {'x': 3.0, 'y': 4.0, 'z': 0.0}
         
-        distance = self.tracker._euclidean_distance(p1, p2)
+        distance = hand_tracker._euclidean_distance(p1, p2)
         
         assert abs(distance - 5.0) < 0.01  # 3-4-5 triangle
+        assert type(distance) is float
     
-    def test_calculate_angle(self):
+    def test_calculate_angle(self, hand_tracker):
         """Test angle calculation"""
         center = {'x': 0.0, 'y': 0.0, 'z': 0.0}
         p1 = {'x': 1.0, 'y': 0.0, 'z': 0.0}
         p2 = {'x': 0.0, 'y': 1.0, 'z': 0.0}
         
-        angle = self.tracker._calculate_angle(center, p1, p2)
+        angle = hand_tracker._calculate_angle(center, p1, p2)
         
         assert abs(angle - 90.0) < 0.01  # 90 degree angle
+        assert type(angle) is float
+    
+    def test_calculate_angle_degenerate(self, hand_tracker):
+        """Test that an angle with zero-length arms is 0, not NaN"""
+        center = {'x': 0.5, 'y': 0.5, 'z': 0.0}
+        
+        angle = hand_tracker._calculate_angle(center, center, center)
+        
+        assert type(angle) is float
+        assert angle == 0.0
+    
+    def test_batched_distances_and_angles(self, hand_tracker):
+        """Test batched distance and angle calculation over point arrays"""
+        centers = np.zeros((4, 3))
+        p1 = np.tile([1.0, 0.0, 0.0], (4, 1))
+        p2 = np.tile([0.0, 1.0, 0.0], (4, 1))
+        
+        distances = hand_tracker._euclidean_distances_batch(p1, p2)
+        angles = hand_tracker._calculate_angles_batch(centers, p1, p2)
+        
+        assert distances.shape == (4,)
+        assert angles.shape == (4,)
+        assert np.allclose(distances, np.sqrt(2.0))
+        assert np.allclose(angles, 90.0)
     
     def test_close(self):
         """Test resource cleanup"""
+        # Uses its own tracker; the shared one is closed by the fixture
+        tracker = HandTracker()
         # Should not raise any exceptions
-        self.tracker.close()
+        tracker.close()
 
 if __name__ == "__main__":
     pytest.main([__file__])
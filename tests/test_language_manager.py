@@ -5,16 +5,17 @@ Unit tests for the LanguageManager module
 import pytest
 from src.core.language_manager import LanguageManager
 
+@pytest.fixture(scope="module")
+def manager():
+    """Shared LanguageManager; the tests only read from it"""
+    return LanguageManager()
+
 class TestLanguageManager:
     """Test cases for LanguageManager class"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.manager = LanguageManager()
-    
-    def test_get_all_languages(self):
+    def test_get_all_languages(self, manager):
         """Test getting all supported languages"""
-        languages = self.manager.get_all_languages()
+        languages = manager.get_all_languages()
         
         assert isinstance(languages, dict)
         assert len(languages) >= 20  # Should have 20+ languages
@@ -22,9 +23,9 @@ class TestLanguageManager:
         assert 'BSL' in languages
         assert 'LSP' in languages
     
-    def test_get_language_details_valid(self):
+    def test_get_language_details_valid(self, manager):
         """Test getting details for a valid language"""
-        details = self.manager.get_language_details('ASL')
+        details = manager.get_language_details('ASL')
         
         assert isinstance(details, dict)
         assert details['name'] == 'American Sign Language'
@@ -32,29 +33,20 @@ class TestLanguageManager:
         assert details['flag'] == '🇺🇸'
         assert details['code'] == 'asl'
     
-    def test_get_language_details_invalid(self):
+    def test_get_language_details_invalid(self, manager):
         """Test getting details for an invalid language"""
-        details = self.manager.get_language_details('INVALID')
+        details = manager.get_language_details('INVALID')
         
         assert details == {}
     
-    def test_language_exists_valid(self):
-        """Test checking existence of valid language"""
-        assert self.manager.language_exists('ASL') is True
-        assert self.manager.language_exists('BSL') is True
-        assert self.manager.language_exists('LSP') is True
-    
-    def test_language_exists_invalid(self):
-        """Test checking existence of invalid language"""
-        assert self.manager.language_exists('INVALID') is False
-        assert self.manager.language_exists('') is False
-        assert self.manager.language_exists('XYZ') is False
-    
-    def test_language_exists_case_insensitive(self):
-        """Test case insensitive language checking"""
-        assert self.manager.language_exists('asl') is True
-        assert self.manager.language_exists('bsl') is True
-        assert self.manager.language_exists('lsp') is True
+    @pytest.mark.parametrize("code,expected", [
+        ('ASL', True), ('BSL', True), ('LSP', True),
+        ('asl', True), ('bsl', True), ('lsp', True),
+        ('INVALID', False), ('', False), ('XYZ', False),
+    ])
+    def test_language_exists(self, manager, code, expected):
+        """Test language existence checks, including case insensitivity"""
+        assert manager.language_exists(code) is expected
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,63 @@
+"""
+Unit tests for the QuizManager module
+"""
+
+import json
+import pytest
+from src.core.quiz_manager import QuizManager
+
+@pytest.fixture(scope="module")
+def quiz_manager():
+    """Shared QuizManager; the tests only read from it"""
+    return QuizManager()
+
+class TestQuizManager:
+    """Test cases for QuizManager class"""
+    
+    def test_get_quiz_returns_question_dicts(self, quiz_manager):
+        """Test that quiz questions are handed out as dicts"""
+        quiz = quiz_manager.get_quiz('ASL', 'basics')
+        
+        assert quiz is not None
+        for question in quiz['questions']:
+            assert isinstance(question, dict)
+            assert question['question']
+            assert len(question['options']) == 4
+            assert question['correct_answer'] in question['options']
+    
+    def test_quiz_json_round_trip(self, quiz_manager):
+        """Test that a quiz survives a JSON round trip with its question keys"""
+        quiz = quiz_manager.get_quiz('ASL', 'advanced')
+        
+        restored = json.loads(json.dumps(quiz))
+        
+        assert restored == quiz
+        assert all('id' in q and 'type' in q for q in restored['questions'])
+    
+    def test_random_quiz_returns_dicts(self, quiz_manager):
+        """Test that random quizzes also carry question dicts"""
+        quiz = quiz_manager.get_random_quiz(language='BSL')
+        
+        assert quiz is not None
+        assert all(isinstance(q, dict) for q in quiz['questions'])
+    
+    def test_returned_quiz_is_a_copy(self, quiz_manager):
+        """Test that mutating a returned quiz does not change later results"""
+        quiz = quiz_manager.get_quiz('ASL', 'numbers')
+        quiz['questions'].clear()
+        
+        assert quiz_manager.get_quiz('ASL', 'numbers')['questions']
+    
+    def test_quiz_statistics_are_a_copy(self, quiz_manager):
+        """Test that mutating returned statistics does not change later results"""
+        stats = quiz_manager.get_quiz_statistics()
+        expected = stats['total_quizzes']
+        stats['total_quizzes'] = 0
+        stats['difficulty_distribution'].clear()
+        
+        fresh = quiz_manager.get_quiz_statistics()
+        assert fresh['total_quizzes'] == expected
+        assert fresh['difficulty_distribution']
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,80 @@
+"""
+Unit tests for the UserManager module
+"""
+
+import json
+import pytest
+from src.core.user_manager import UserManager
+
+@pytest.fixture
+def manager():
+    """Fresh UserManager with only the demo user"""
+    return UserManager()
+
+class TestUserManager:
+    """Test cases for UserManager class"""
+    
+    def test_new_user_password_is_verified(self, manager):
+        """Test that a created account only accepts its own password"""
+        assert manager.authenticate_user('new@example.com', 'secret') is not None
+        
+        assert manager.authenticate_user('new@example.com', 'wrong') is None
+        assert manager.authenticate_user('new@example.com', 'secret') is not None
+    
+    def test_authenticated_user_has_no_credentials(self, manager):
+        """Test that returned user data carries no credential fields and serializes"""
+        user = manager.authenticate_user('new@example.com', 'secret')
+        
+        for record in (user, manager.current_user, manager.get_user_data(user['user_id'])):
+            assert 'password_hash' not in record
+            assert 'password_salt' not in record
+            assert 'password_kdf' not in record
+            json.dumps(record)
+
+    def test_user_data_is_a_copy(self, manager):
+        """Test that mutating returned user data does not bypass the update methods"""
+        user = manager.get_user_data('demo_user')
+        user['statistics']['total_signs_learned'] = 999
+        
+        assert manager.get_user_data('demo_user')['statistics']['total_signs_learned'] == 12
+        assert manager.get_user_progress('demo_user')['signs_learned'] == 12
+    
+    def test_user_progress_is_a_copy(self, manager):
+        """Test that mutating returned progress does not change the cached figures"""
+        manager.get_user_progress('demo_user')['signs_learned'] = 999
+        
+        assert manager.get_user_progress('demo_user')['signs_learned'] == 12
+
+    def test_daily_goal_is_a_copy(self, manager):
+        """Test that mutating a returned daily goal status does not change the cached one"""
+        status = manager.check_daily_goal('demo_user')
+        met_goal = status['met_goal']
+        status['met_goal'] = not met_goal
+        
+        assert manager.check_daily_goal('demo_user')['met_goal'] == met_goal
+    
+    def test_leaderboard_keeps_fractional_values(self, manager):
+        """Test that fractional session totals are ranked and shown unrounded"""
+        user = manager.authenticate_user('new@example.com', 'secret')
+        manager.update_user_statistics(user['user_id'], {'signs_learned': 12.5})
+        
+        leaderboard = manager.get_leaderboard('signs_learned', limit=1)
+        
+        assert leaderboard[0]['name'] == 'New'
+        assert leaderboard[0]['value'] == 12.5
+    
+    def test_leaderboard_ties_are_ordered_by_user_id(self, manager):
+        """Test that tied users at the cutoff are picked deterministically"""
+        user_ids = [manager.authenticate_user(f'user{i}@example.com', 'secret')['user_id'] for i in range(4)]
+        for user_id in user_ids:
+            manager.update_user_statistics(user_id, {'signs_learned': 5})
+        
+        leaderboard = manager.get_leaderboard('signs_learned', limit=3)
+        
+        expected = [manager.get_user_data('demo_user')['name']] + [
+            manager.get_user_data(user_id)['name'] for user_id in sorted(user_ids)[:2]
+        ]
+        assert [entry['name'] for entry in leaderboard] == expected
+
+if __name__ == "__main__":
+    pytest.main([__file__])